@@ -6,89 +6,220 @@ compares against stored sync state, classifies items as NEW/CHANGED/UNCHANGED/OR
 """
 
 import argparse
+import functools
 import hashlib
 import json
 import os
 import re
 import sys
-from typing import Any, Callable, Dict, List, Optional
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+# Sync state YAML top-level line patterns, compiled once. Indented item lines
+# are parsed with str methods (see _parse_item_id / _parse_item_prop).
+_SECTION_RE = re.compile(r'^(epics|stories|tasks|iterations):\s*$')
+_TOP_KEY_RE = re.compile(r'^\w')
 
+# Runs of characters replaced by a single '-' in iteration slugs
+_SLUG_SEP_RE = re.compile(r'[^a-z0-9]+')
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize(text: Optional[str]) -> str:
-    """Normalize text: trim, collapse whitespace, lowercase."""
+    """Normalize text: trim, collapse whitespace, lowercase.
+
+    str.split() with no separator splits on the same Unicode whitespace set as
+    the regex \\s class, so this matches strip + re.sub + lower in one pass.
+    Results are cached: statuses, phases and titles repeat across items.
+    """
     if not text:
         return ""
-    text = text.strip()
-    text = re.sub(r'\s+', ' ', text)
-    text = text.lower()
-    return text
+    return " ".join(text.split()).lower()
 
 
 def normalize_list(items: Optional[List]) -> str:
     """Sort list items and join with comma."""
     if not items:
         return ""
-    return ",".join(sorted(str(i).strip().lower() for i in items if str(i).strip()))
+    return _normalize_tuple(tuple(str(i) for i in items))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_tuple(items: Tuple[str, ...]) -> str:
+    """Cached body of normalize_list; lists are unhashable, so callers pass a tuple."""
+    cleaned = [v for v in (i.strip().lower() for i in items) if v]
+    cleaned.sort()
+    return ",".join(cleaned)
+
+
+# Pre-initialized SHA-256 state; .copy() skips the constructor's digest setup
+_SHA256_SEED = hashlib.sha256()
 
 
 def compute_hash(content_string: str) -> str:
     """SHA-256 hash, first 12 hex chars."""
-    h = hashlib.sha256(content_string.encode("utf-8")).hexdigest()
-    return h[:12]
+    h = _SHA256_SEED.copy()
+    h.update(content_string.encode("utf-8"))
+    return h.hexdigest()[:12]
 
 
-def hash_epic(epic: Dict[str, Any], epic_statuses: Optional[Dict[str, str]] = None) -> str:
-    """Compute content hash for an epic.
+def compute_hash_batch(content_strings: List[str]) -> List[str]:
+    """SHA-256 hash a batch of content strings, first 12 hex chars each.
 
-    Includes normalized epic status in hash so status changes trigger CHANGED classification.
+    Equivalent to [compute_hash(s) for s in content_strings] but resolves the
+    seed clone method once for the whole batch. hashlib is backed by OpenSSL,
+    which already dispatches to SHA-NI/AVX2 at runtime where the CPU supports it.
+    Items are independent, so identical content strings (common for tasks like
+    "Write tests") are hashed once and the digest is reused.
+    """
+    seed = _SHA256_SEED.copy
+    digests = {}
+    results = []
+    for s in content_strings:
+        digest = digests.get(s)
+        if digest is None:
+            h = seed()
+            h.update(s.encode("utf-8"))
+            digest = h.hexdigest()[:12]
+            digests[s] = digest
+        results.append(digest)
+    return results
+
+
+def normalize_statuses(statuses: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Normalize every status in an ID -> status map once, interning the results.
+
+    Statuses come from a handful of values, so callers resolve each item's status
+    with a plain dict lookup instead of re-normalizing it per item.
+    """
+    if not statuses:
+        return {}
+    return {item_id: sys.intern(normalize(status)) for item_id, status in statuses.items()}
+
+
+def epic_content(epic: Dict[str, Any], status: str = "") -> str:
+    """Build the normalized content string hashed for an epic.
+
+    status must already be normalized (see normalize_statuses).
     """
-    status = ""
-    if epic_statuses:
-        status = epic_statuses.get(epic.get("id", ""), "")
     parts = [
         normalize(epic.get("title", "")),
         normalize(epic.get("description", "")),
         normalize(epic.get("phase", "")),
         normalize_list(epic.get("requirements", [])),
-        normalize(status)
+        status
     ]
-    return compute_hash("|".join(parts))
+    return "|".join(parts)
 
 
-def hash_story(story: Dict[str, Any], story_statuses: Optional[Dict[str, str]] = None) -> str:
-    """Compute content hash for a story.
+def story_content(story: Dict[str, Any], status: str = "") -> str:
+    """Build the normalized content string hashed for a story.
 
-    Includes normalized status in hash so status changes trigger CHANGED classification.
+    status must already be normalized (see normalize_statuses).
     """
-    status = ""
-    if story_statuses:
-        status = story_statuses.get(story.get("id", ""), "")
     parts = [
         normalize(story.get("title", "")),
         normalize(story.get("userStoryText", "")),
         normalize(story.get("acceptanceCriteria", "")),
-        normalize(status)
+        status
     ]
-    return compute_hash("|".join(parts))
+    return "|".join(parts)
 
 
-def hash_task(task: Dict[str, Any]) -> str:
-    """Compute content hash for a task."""
+def task_content(task: Dict[str, Any]) -> str:
+    """Build the normalized content string hashed for a task."""
     state = "complete" if task.get("complete", False) else "incomplete"
     parts = [
         normalize(task.get("description", "")),
         state
     ]
-    return compute_hash("|".join(parts))
+    return "|".join(parts)
+
+
+def hash_epic(epic: Dict[str, Any], epic_statuses: Optional[Dict[str, str]] = None) -> str:
+    """Compute content hash for an epic.
+
+    Includes normalized epic status in hash so status changes trigger CHANGED classification.
+    """
+    status = ""
+    if epic_statuses:
+        status = epic_statuses.get(epic.get("id", ""), "")
+    return compute_hash(epic_content(epic, normalize(status)))
+
+
+def hash_story(story: Dict[str, Any], story_statuses: Optional[Dict[str, str]] = None) -> str:
+    """Compute content hash for a story.
+
+    Includes normalized status in hash so status changes trigger CHANGED classification.
+    """
+    status = ""
+    if story_statuses:
+        status = story_statuses.get(story.get("id", ""), "")
+    return compute_hash(story_content(story, normalize(status)))
+
+
+def hash_task(task: Dict[str, Any]) -> str:
+    """Compute content hash for a task."""
+    return compute_hash(task_content(task))
 
 
 def generate_iteration_slug(epic_id: str, title: str) -> str:
     """Generate a kebab-case iteration slug from epic ID and title."""
-    slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
+    slug = _SLUG_SEP_RE.sub('-', title.lower()).strip('-')
     full = f"epic-{epic_id}-{slug}"
     return full[:128].rstrip('-') if len(full) > 128 else full
 
 
+def _parse_item_id(line: str) -> Optional[str]:
+    """Parse a sync state item ID line ('  "1.1":' or '  epic-1-foo:').
+
+    Equivalent to matching ^  (?! )"?([^":]+)"?:\\s*$ and stripping the group,
+    using str methods since the writer emits a fixed 2-space indent.
+    Returns None if the line is not an item ID line.
+    """
+    if not line.startswith("  ") or line[2:3] in ("", " "):
+        return None
+    body = line[2:].rstrip()
+    if not body.endswith(":"):
+        return None
+    body = body[:-1]
+    if body.startswith('"'):
+        body = body[1:]
+    if body.endswith('"'):
+        body = body[:-1]
+    if not body or '"' in body or ":" in body:
+        return None
+    return body.strip()
+
+
+def _parse_item_prop(line: str) -> Optional[Tuple[str, str]]:
+    """Parse a sync state property line ('    key: value' or '    key: "value"').
+
+    Equivalent to matching ^    (\\w+):\\s*"?([^"]*)"?\\s*$ and stripping the value.
+    Returns (key, value) or None if the line is not a property line.
+    """
+    key, sep, value = line[4:].partition(":")
+    if not sep or not key or not all(c.isalnum() or c == "_" for c in key):
+        return None
+    value = value.lstrip()
+    if value.startswith('"'):
+        value = value[1:]
+    value, _, rest = value.partition('"')
+    if rest.strip():
+        return None
+    return key, value.strip()
+
+
+def load_json(path: str) -> Any:
+    """Read and decode a JSON file in one binary read.
+
+    json.loads accepts UTF-8 bytes directly, which skips the text-mode
+    decoding layer that json.load(f) reads through.
+    """
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
 def load_sync_state(path: Optional[str]) -> Dict[str, Dict]:
     """Load existing sync YAML state. Returns dict with epics/stories/tasks/iterations."""
     empty = {"epics": {}, "stories": {}, "tasks": {}, "iterations": {}}
@@ -106,44 +237,45 @@ def load_sync_state(path: Optional[str]) -> Dict[str, Dict]:
     current_item = {}
 
     for line in content.splitlines():
-        # Top-level sections
-        section_match = re.match(r'^(epics|stories|tasks|iterations):\s*$', line)
-        if section_match:
-            # Save pending item before switching sections
-            if current_section and current_id and current_item:
-                result[current_section][current_id] = current_item
-            current_section = section_match.group(1)
-            current_id = None
-            current_item = {}
-            continue
-        if re.match(r'^\w', line) and not line.startswith(" "):
-            # Other top-level key (like lastFullSync) — save pending item
-            if current_section and current_id and current_item:
-                result[current_section][current_id] = current_item
-            current_section = None
-            current_id = None
-            current_item = {}
+        if not line.startswith(" "):
+            # Top-level sections
+            section_match = _SECTION_RE.match(line)
+            if section_match:
+                # Save pending item before switching sections
+                if current_section and current_id and current_item:
+                    result[current_section][current_id] = current_item
+                current_section = section_match.group(1)
+                current_id = None
+                current_item = {}
+            elif _TOP_KEY_RE.match(line):
+                # Other top-level key (like lastFullSync) — save pending item
+                if current_section and current_id and current_item:
+                    result[current_section][current_id] = current_item
+                current_section = None
+                current_id = None
+                current_item = {}
+            # Unindented lines never match the item patterns below
             continue
 
         if not current_section:
             continue
 
-        # Item ID line: "  "1":"  or  "  1.1-T1:" (exactly 2-space indent, not 4+)
-        id_match = re.match(r'^  (?! )"?([^":]+)"?:\s*$', line)
-        if id_match:
-            # Save previous item
-            if current_id and current_item:
-                result[current_section][current_id] = current_item
-            current_id = id_match.group(1).strip()
-            current_item = {}
+        if not line.startswith("    "):
+            # Item ID line: "  "1":"  or  "  1.1-T1:" (exactly 2-space indent, not 4+)
+            item_id = _parse_item_id(line)
+            if item_id is not None:
+                # Save previous item
+                if current_id and current_item:
+                    result[current_section][current_id] = current_item
+                current_id = item_id
+                current_item = {}
             continue
 
         # Properties: "    key: value"
         if current_id:
-            prop_match = re.match(r'^    (\w+):\s*"?([^"]*)"?\s*$', line)
-            if prop_match:
-                key = prop_match.group(1)
-                val = prop_match.group(2).strip()
+            prop = _parse_item_prop(line)
+            if prop:
+                key, val = prop
                 # Try to parse as int for devopsId
                 if key in ("devopsId", "epicDevopsId", "storyDevopsId"):
                     try:
@@ -159,20 +291,24 @@ def load_sync_state(path: Optional[str]) -> Dict[str, Dict]:
     return result
 
 
-def classify_items(parsed_items: List[Dict], stored_items: Dict, hash_fn: Callable, id_field: str = "id") -> List[Dict]:
-    """Classify items as NEW/CHANGED/UNCHANGED/ORPHANED."""
-    results = []
+def classify_items(parsed_items: List[Dict], stored_items: Dict, hash_fn: Optional[Callable] = None,
+                   id_field: str = "id", hashes: Optional[List[str]] = None) -> List[Dict]:
+    """Classify items as NEW/CHANGED/UNCHANGED/ORPHANED.
 
-    parsed_ids = set()
-    for item in parsed_items:
-        item_id = item[id_field]
-        parsed_ids.add(item_id)
-        new_hash = hash_fn(item)
+    Pass either hash_fn (called per item) or hashes, a list of precomputed
+    content hashes aligned with parsed_items (see compute_hash_batch).
+    Parsed item dicts are annotated in place (contentHash, classification,
+    devopsId, attached) and returned in the result list, not copied.
+    """
+    if hashes is None:
+        hashes = [hash_fn(item) for item in parsed_items]
+    parsed_ids = frozenset(item[id_field] for item in parsed_items)
 
-        stored = stored_items.get(item_id, {})
+    results = []
+    no_state = {}
+    for item, new_hash in zip(parsed_items, hashes):
+        stored = stored_items.get(item[id_field], no_state)
         old_hash = stored.get("contentHash", "")
-        devops_id = stored.get("devopsId", None)
-        attached = stored.get("attached", "")
 
         if not old_hash:
             classification = "NEW"
@@ -181,15 +317,13 @@ def classify_items(parsed_items: List[Dict], stored_items: Dict, hash_fn: Callab
         else:
             classification = "CHANGED"
 
-        result_item = {
-            **item,
-            "contentHash": new_hash,
-            "classification": classification,
-            "devopsId": devops_id
-        }
+        item["contentHash"] = new_hash
+        item["classification"] = classification
+        item["devopsId"] = stored.get("devopsId", None)
+        attached = stored.get("attached", "")
         if attached:
-            result_item["attached"] = attached
-        results.append(result_item)
+            item["attached"] = attached
+        results.append(item)
 
     # Find orphaned items (in stored but not in parsed)
     for item_id, stored in stored_items.items():
@@ -204,62 +338,33 @@ def classify_items(parsed_items: List[Dict], stored_items: Dict, hash_fn: Callab
     return results
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Compute content hashes and classify items for sync diff"
-    )
-    parser.add_argument("--parsed", required=True, help="Path to parsed artifacts JSON (from parse-artifacts.py)")
-    parser.add_argument("--sync-state", default="", help="Path to existing devops-sync.yaml")
-    parser.add_argument("--output", required=True, help="Path to write diff results JSON")
-    args = parser.parse_args()
+def group_ids(items: List[Dict], key: str) -> Dict[str, List[str]]:
+    """Group item IDs by a parent key, preserving input order within each group.
 
-    # Load parsed data
-    with open(args.parsed, "r", encoding="utf-8") as f:
-        parsed = json.load(f)
-
-    # Load existing sync state
-    sync_state = load_sync_state(args.sync_state)
-
-    # Extract statuses from parsed data
-    story_statuses = parsed.get("storyStatuses", {})
-    epic_statuses = parsed.get("epicStatuses", {})
-
-    # Classify each type
-    epic_results = classify_items(
-        parsed.get("epics", []),
-        sync_state.get("epics", {}),
-        lambda e: hash_epic(e, epic_statuses)
-    )
+    Items with an empty or missing parent key are skipped.
+    """
+    groups = defaultdict(list)
+    for item in items:
+        parent = item.get(key, "")
+        if parent:
+            groups[parent].append(item["id"])
+    return groups
 
-    story_results = classify_items(
-        parsed.get("stories", []),
-        sync_state.get("stories", {}),
-        lambda s: hash_story(s, story_statuses)
-    )
 
-    task_results = classify_items(
-        parsed.get("tasks", []),
-        sync_state.get("tasks", {}),
-        hash_task
-    )
+def derive_iterations(parsed: Dict[str, Any], sync_state: Dict[str, Dict], epic_statuses: Dict[str, str]) -> List[Dict]:
+    """Derive epic-based iterations for epics with status in-progress or done.
 
-    # Derive epic-based iterations for epics with status in-progress or done
+    NEW iterations carry all of the epic's story and task IDs; EXISTS iterations
+    carry only items not yet in sync state (already-synced items were moved before).
+    """
     iteration_results = []
     stored_iterations = sync_state.get("iterations", {})
+    stored_stories = sync_state.get("stories", {})
+    stored_tasks = sync_state.get("tasks", {})
 
-    # Build lookup: story epicId -> list of story IDs
-    story_ids_by_epic = {}
-    for story in parsed.get("stories", []):
-        eid = story.get("epicId", "")
-        if eid:
-            story_ids_by_epic.setdefault(eid, []).append(story["id"])
-
-    # Build lookup: task storyId -> list of task IDs
-    task_ids_by_story = {}
-    for task in parsed.get("tasks", []):
-        sid = task.get("storyId", "")
-        if sid:
-            task_ids_by_story.setdefault(sid, []).append(task["id"])
+    # Build lookups in one pass each: epicId -> story IDs, storyId -> task IDs
+    story_ids_by_epic = group_ids(parsed.get("stories", []), "epicId")
+    task_ids_by_story = group_ids(parsed.get("tasks", []), "storyId")
 
     for epic in parsed.get("epics", []):
         epic_id = epic.get("id", "")
@@ -287,10 +392,8 @@ def main():
         if slug in stored_iterations and has_devops_id:
             # EXISTS iteration: only include NEW items that need assignment.
             # UNCHANGED and CHANGED items are already in this iteration.
-            new_story_ids = [sid for sid in epic_story_ids
-                            if sid not in sync_state.get("stories", {})]
-            new_task_ids = [tid for tid in epic_task_ids
-                           if tid not in sync_state.get("tasks", {})]
+            new_story_ids = [sid for sid in epic_story_ids if sid not in stored_stories]
+            new_task_ids = [tid for tid in epic_task_ids if tid not in stored_tasks]
             iteration_results.append({
                 "slug": slug,
                 "epicId": epic_id,
@@ -309,37 +412,37 @@ def main():
                 "devopsId": None
             })
 
-    # Compute summary counts
-    def count_by_class(items):
-        counts = {"NEW": 0, "CHANGED": 0, "UNCHANGED": 0, "ORPHANED": 0, "EXISTS": 0}
-        for item in items:
-            cls = item["classification"]
-            counts[cls] = counts.get(cls, 0) + 1
-        return counts
+    return iteration_results
 
-    epic_counts = count_by_class(epic_results)
-    story_counts = count_by_class(story_results)
-    task_counts = count_by_class(task_results)
-    iter_counts = count_by_class(iteration_results)
 
-    # Estimate CLI calls
-    # Count NEW stories that have a non-default status needing a state update
-    new_story_state_updates = 0
-    for s in story_results:
-        if s["classification"] == "NEW" and story_statuses.get(s.get("id", "")):
-            status = story_statuses[s["id"]]
-            if status not in ("draft", ""):
-                new_story_state_updates += 1
+def count_by_class(items: List[Dict]) -> Dict[str, int]:
+    """Count items per classification (NEW/CHANGED/UNCHANGED/ORPHANED/EXISTS)."""
+    counts = {"NEW": 0, "CHANGED": 0, "UNCHANGED": 0, "ORPHANED": 0, "EXISTS": 0}
+    counts.update(Counter(item["classification"] for item in items))
+    return counts
 
-    # Count story attachment calls (upload + relation add = 2 per story with file)
-    story_file_paths = parsed.get("storyFilePaths", {})
+
+def estimate_cli_calls(epic_counts: Dict[str, int], story_counts: Dict[str, int], task_counts: Dict[str, int],
+                       story_results: List[Dict], iteration_results: List[Dict],
+                       story_statuses: Dict[str, str], story_file_paths: Dict[str, str]) -> int:
+    """Estimate the number of az CLI / REST calls sync-devops.py will make."""
+    # One pass over stories counts both:
+    # - NEW stories with a non-default status needing a state update
+    # - story attachment calls (upload + relation add = 2 per story with file)
+    new_story_state_updates = 0
     attachment_calls = 0
     for s in story_results:
-        has_file = story_file_paths.get(s.get("id", ""))
-        if s["classification"] in ("NEW", "CHANGED") and has_file:
-            attachment_calls += 2  # REST upload + az relation add
-        elif s["classification"] == "UNCHANGED" and s.get("attached") != "true" and has_file:
-            attachment_calls += 2  # backfill attachment for previously-synced story
+        cls = s["classification"]
+        story_id = s.get("id", "")
+        if cls == "NEW":
+            status = story_statuses.get(story_id)
+            if status and status != "draft":
+                new_story_state_updates += 1
+        if story_file_paths.get(story_id):
+            if cls == "NEW" or cls == "CHANGED":
+                attachment_calls += 2  # REST upload + az relation add
+            elif cls == "UNCHANGED" and s.get("attached") != "true":
+                attachment_calls += 2  # backfill attachment for previously-synced story
 
     cli_calls = (
         epic_counts["NEW"] + epic_counts["CHANGED"]  # epic create/update
@@ -362,6 +465,73 @@ def main():
             cli_calls += len(it.get("storyIds", []))  # move new stories
             cli_calls += len(it.get("taskIds", []))  # move new tasks
 
+    return cli_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute content hashes and classify items for sync diff"
+    )
+    parser.add_argument("--parsed", required=True, help="Path to parsed artifacts JSON (from parse-artifacts.py)")
+    parser.add_argument("--sync-state", default="", help="Path to existing devops-sync.yaml")
+    parser.add_argument("--output", required=True, help="Path to write diff results JSON")
+    args = parser.parse_args()
+
+    # Load parsed data
+    parsed = load_json(args.parsed)
+
+    # Load existing sync state
+    sync_state = load_sync_state(args.sync_state)
+
+    # Extract statuses from parsed data
+    story_statuses = parsed.get("storyStatuses", {})
+    epic_statuses = parsed.get("epicStatuses", {})
+
+    # Normalize statuses once for hashing; the raw maps are passed through to the output
+    epic_hash_statuses = normalize_statuses(epic_statuses)
+    story_hash_statuses = normalize_statuses(story_statuses)
+
+    # Build content strings for every section, then hash them in a single batch
+    # so identical content is hashed once across epics, stories and tasks
+    epics = parsed.get("epics", [])
+    stories = parsed.get("stories", [])
+    tasks = parsed.get("tasks", [])
+    hashes = compute_hash_batch(
+        [epic_content(e, epic_hash_statuses.get(e.get("id", ""), "")) for e in epics]
+        + [story_content(s, story_hash_statuses.get(s.get("id", ""), "")) for s in stories]
+        + [task_content(t) for t in tasks]
+    )
+    story_start = len(epics)
+    task_start = story_start + len(stories)
+
+    # Classify each type
+    epic_results = classify_items(
+        epics, sync_state.get("epics", {}), hashes=hashes[:story_start]
+    )
+    story_results = classify_items(
+        stories, sync_state.get("stories", {}), hashes=hashes[story_start:task_start]
+    )
+    task_results = classify_items(
+        tasks, sync_state.get("tasks", {}), hashes=hashes[task_start:]
+    )
+
+    # Derive epic-based iterations for epics with status in-progress or done
+    iteration_results = derive_iterations(parsed, sync_state, epic_statuses)
+
+    # Compute summary counts
+    epic_counts = count_by_class(epic_results)
+    story_counts = count_by_class(story_results)
+    task_counts = count_by_class(task_results)
+    iter_counts = count_by_class(iteration_results)
+
+    # Estimate CLI calls
+    story_file_paths = parsed.get("storyFilePaths", {})
+    cli_calls = estimate_cli_calls(
+        epic_counts, story_counts, task_counts,
+        story_results, iteration_results,
+        story_statuses, story_file_paths
+    )
+
     result = {
         "epics": epic_results,
         "stories": story_results,
@@ -379,12 +549,15 @@ def main():
         }
     }
 
+    # Serialize once; the same payload goes to the output file and stdout
+    payload = json.dumps(result, indent=2)
+
     # Write output
     os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
     with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2)
+        f.write(payload)
 
-    print(json.dumps(result, indent=2))
+    print(payload)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ Outputs JSON to stdout: {"processTemplate": "Scrum", "workItemTypes": [...]}
 
 import argparse
 import base64
+import gzip
 import json
 import os
 import sys
@@ -28,6 +29,14 @@ def build_auth_header(pat: str) -> str:
     return f"Basic {token}"
 
 
+def read_body(resp: Any) -> bytes:
+    # Responses and HTTPError bodies alike may be gzip-encoded once we ask for it
+    body = resp.read()
+    if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+        body = gzip.decompress(body)
+    return body
+
+
 def fetch_work_item_types(org_url: str, project: str, pat: str) -> Dict[str, Any]:
     org_url = org_url.rstrip("/")
     url = f"{org_url}/{urllib.request.quote(project)}/_apis/wit/workitemtypes?api-version=7.0"
@@ -35,15 +44,17 @@ def fetch_work_item_types(org_url: str, project: str, pat: str) -> Dict[str, Any
     req = urllib.request.Request(url)
     req.add_header("Authorization", build_auth_header(pat))
     req.add_header("Accept", "application/json")
+    # The work item type list is large, highly compressible JSON
+    req.add_header("Accept-Encoding", "gzip")
 
     try:
         with urllib.request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+            data = json.loads(read_body(resp).decode("utf-8"))
             return data
     except urllib.error.HTTPError as e:
         body = ""
         try:
-            body = e.read().decode("utf-8", errors="replace")
+            body = read_body(e).decode("utf-8", errors="replace")
         except Exception:
             pass
         print(json.dumps({
@@ -56,17 +67,18 @@ def fetch_work_item_types(org_url: str, project: str, pat: str) -> Dict[str, Any
         sys.exit(1)
 
 
+# Story-level work item type -> process template, in priority order
+TEMPLATE_MARKERS = (
+    ("User Story", "Agile"),
+    ("Product Backlog Item", "Scrum"),
+    ("Requirement", "CMMI"),
+    ("Issue", "Basic"),
+)
+
+
 def detect_template(type_names: List[str]) -> str:
-    names = set(type_names)
-    if "User Story" in names:
-        return "Agile"
-    if "Product Backlog Item" in names:
-        return "Scrum"
-    if "Requirement" in names:
-        return "CMMI"
-    if "Issue" in names:
-        return "Basic"
-    return "Unknown"
+    names = frozenset(type_names)
+    return next((template for marker, template in TEMPLATE_MARKERS if marker in names), "Unknown")
 
 
 def main():
@@ -5,11 +5,109 @@ Cross-platform, stdlib-only. Auto-detects heading levels.
 """
 
 import argparse
+import functools
+import html
 import json
+import operator
 import os
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+# Story files are small; threads mainly overlap file reads (regex matching
+# holds the GIL), so a handful of workers is enough.
+_MAX_PARSE_WORKERS = 8
+
+_STORY_ID_KEY = operator.itemgetter("storyId")
+
+_PRIORITY_MAP = {"high": 1, "medium": 2, "low": 3}
+_FILEPATH_RE = re.compile(r'\[([^\]]+\.\w+(?::\d+)?)\]\s*$')
+# Bracket tags (with trailing whitespace) or the end-anchored file path
+_REVIEW_META_RE = re.compile(
+    r'\[(?:(?P<prio>HIGH|MEDIUM|LOW)|(?P<ai>AI-Review))\]\s*'
+    r'|\[(?P<fp>[^\]]+\.\w+(?::\d+)?)\]\s*$',
+    re.IGNORECASE
+)
+_AC_RE = re.compile(r'\(AC:\s*([\d,\s]+)\)')
+# A number that makes up a whole comma-separated entry ("1 2" is not one)
+_AC_NUM_RE = re.compile(r'(?:^|,)\s*(\d+)(?=\s*(?:,|$))')
+# Whole-content heading searches; [^\S\n] keeps a match on a single line
+_STORY_LEVEL_RE = re.compile(r'^(#{1,6})[^\S\n]+Story[^\S\n]+\d+\.\d+:', re.MULTILINE)
+_EPIC_LEVEL_RE = re.compile(r'^(#{1,6})[^\S\n]+Epic[^\S\n]+\d+:', re.MULTILINE)
+# Line boundaries str.splitlines() honours besides "\n"
+_LINE_BREAKS_RE = re.compile('[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+_PHASE_RE = re.compile(r'^\*\*(?:Target\s+)?Phase:\*\*\s*(.+)', re.IGNORECASE)
+_DEPS_RE = re.compile(r'^\*\*Depend(?:s on|encies):\*\*\s*(.+)', re.IGNORECASE)
+_DEPS_SPLIT_RE = re.compile(r'[,;]')
+_REQ_RE = re.compile(r'(?:FR|NFR|ARCH)-[\w.]+')
+_ANY_HEADING_RE = re.compile(r'^#+\s+')
+_HEADING_RE = re.compile(r'^#{1,6}\s+')
+_AC_HEADER_RE = re.compile(r'^\*\*Acceptance Criteria:\*\*|^#{1,6}\s+Acceptance Criteria')
+_AC_HEADING_RE = re.compile(r'^#{1,6}\s+Acceptance Criteria')
+_BOLD_LABEL_RE = re.compile(r'^\*\*[^*]+:\*\*')
+_AC_BOLD_RE = re.compile(r'^\*\*Acceptance Criteria:\*\*')
+_STATUS_RE = re.compile(r'^\*?\*?Status:\*?\*?[^\S\n]*(.+)$', re.IGNORECASE | re.MULTILINE)
+_TASKS_HEADER_RE = re.compile(r'^##\s+Tasks\s*/?\s*Subtasks', re.IGNORECASE)
+_SUBHEADING_RE = re.compile(r'^#{2,}\s+')
+_TASKS_HEADING_RE = re.compile(r'^#{2,}\s+Tasks', re.IGNORECASE)
+_TASK_RE = re.compile(r'^- \[([ xX])\]\s*(.+)$')
+_SUBTASK_RE = re.compile(r'^\s{2,}- \[([ xX])\]\s*(.+)$')
+# Story-file lines the task/review scan cares about, one line per match
+_STORY_LINE_RE = re.compile(
+    r'^(?:(?P<heading>##.*)|(?P<task>- \[.*)|(?P<subtask>[^\S\n]{2,}- \[.*))$',
+    re.MULTILINE
+)
+_REVIEW_HEADER_RE = re.compile(
+    r'^###\s+Review Follow-ups(?:\s+Round\s+(\d+))?\s*\(AI\)\s*$', re.IGNORECASE
+)
+_SECTION_HEADING_RE = re.compile(r'^##\s+')
+_FILENAME_RE = re.compile(r'^(\d+)-(\d+)-')
+_STORY_DIR_RE = re.compile(r'^\d+\.\d+$')
+_DEV_STATUS_RE = re.compile(r'^development_status:\s*$')
+_EPIC_STATUS_RE = re.compile(r'^\s+epic-(\d+):\s*(\S+)\s*$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _review_metadata(description: str) -> Tuple[Optional[int], Optional[str], str, bool]:
+    """Cached body of extract_review_metadata: (priority, filePath, cleanTitle, aiReview)."""
+    priority = None
+    file_path = None
+    file_path_start = -1
+    ai_review = False
+
+    # One scan collects priority, AI-Review tag and file path; the clean
+    # title is spliced together from the text between the bracket tags.
+    parts = []
+    pos = 0
+    for m in _REVIEW_META_RE.finditer(description):
+        kind = m.lastgroup
+        if kind == "fp":
+            file_path = m.group("fp")
+            file_path_start = m.start()
+            continue
+        if kind == "prio":
+            if priority is None:
+                priority = _PRIORITY_MAP[m.group("prio").lower()]
+        else:
+            ai_review = True
+        parts.append(description[pos:m.start()])
+        pos = m.end()
+
+    if parts:
+        parts.append(description[pos:])
+        clean = "".join(parts)
+        # Removing tags can leave a file path at the end of the title
+        fm = _FILEPATH_RE.search(clean)
+        if fm:
+            clean = clean[:fm.start()]
+    elif file_path is not None:
+        clean = description[:file_path_start]
+    else:
+        clean = description
+    clean = clean.strip()
+
+    return priority, file_path, clean if clean else description.strip(), ai_review
 
 
 def extract_review_metadata(description: str) -> Dict[str, Any]:
@@ -24,53 +122,31 @@ def extract_review_metadata(description: str) -> Dict[str, Any]:
     Returns dict with keys: priority, filePath, cleanTitle, tags.
     Missing fields are None or empty list.
     """
-    priority_map = {"high": 1, "medium": 2, "low": 3}
-    priority = None
-    file_path = None
-    tags = []
-
-    # Extract priority
-    pm = re.search(r'\[(HIGH|MEDIUM|LOW)\]', description, re.IGNORECASE)
-    if pm:
-        priority = priority_map[pm.group(1).lower()]
-
-    # Extract file path (anchored to end of string)
-    fm = re.search(r'\[([^\]]+\.\w+(?::\d+)?)\]\s*$', description)
-    if fm:
-        file_path = fm.group(1)
-
-    # Extract AI-Review tag
-    if re.search(r'\[AI-Review\]', description, re.IGNORECASE):
-        tags.append("AI-Review")
-
-    # Build clean title: strip all [...] tags and trailing file path
-    clean = re.sub(r'\[(?:HIGH|MEDIUM|LOW|AI-Review)\]\s*', '', description, flags=re.IGNORECASE)
-    clean = re.sub(r'\[[^\]]+\.\w+(?::\d+)?\]\s*$', '', clean)
-    clean = clean.strip()
-
+    priority, file_path, clean_title, ai_review = _review_metadata(description)
     return {
         "priority": priority,
         "filePath": file_path,
-        "cleanTitle": clean if clean else description.strip(),
-        "tags": tags
+        "cleanTitle": clean_title,
+        "tags": ["AI-Review"] if ai_review else []
     }
 
 
+@functools.lru_cache(maxsize=4096)
+def _ac_references(description: str) -> Tuple[int, ...]:
+    """Cached body of extract_ac_references; a tuple so cached results can't be mutated."""
+    m = _AC_RE.search(description)
+    if not m:
+        return ()
+    return tuple(sorted({int(n) for n in _AC_NUM_RE.findall(m.group(1))}))
+
+
 def extract_ac_references(description: str) -> List[int]:
     """Extract acceptance criteria references from a task description.
 
     Matches patterns like (AC: 1), (AC: 1, 2, 3), (AC: 1, 3).
     Returns sorted unique list of ints.
     """
-    m = re.search(r'\(AC:\s*([\d,\s]+)\)', description)
-    if not m:
-        return []
-    nums = set()
-    for part in m.group(1).split(","):
-        part = part.strip()
-        if part.isdigit():
-            nums.add(int(part))
-    return sorted(nums)
+    return list(_ac_references(description))
 
 
 def build_subtask_html(subtasks: List[Dict[str, Any]]) -> str:
@@ -82,14 +158,27 @@ def build_subtask_html(subtasks: List[Dict[str, Any]]) -> str:
     """
     if not subtasks:
         return ""
-    items = []
+    parts = ["<div><ul>"]
+    append = parts.append
+    escape = html.escape
     for st in subtasks:
-        check = "&#9745;" if st.get("complete", False) else "&#9744;"
+        append("<li>&#9745; " if st.get("complete", False) else "<li>&#9744; ")
         # Escape HTML in description
-        desc = st.get("description", "")
-        desc = desc.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        items.append(f"<li>{check} {desc}</li>")
-    return "<div><ul>" + "".join(items) + "</ul></div>"
+        append(escape(st.get("description", ""), quote=False))
+        append("</li>")
+    append("</ul></div>")
+    return "".join(parts)
+
+
+def _multiline_view(content: str) -> str:
+    """Return content with every str.splitlines() boundary written as "\\n".
+
+    Lets MULTILINE patterns see exactly the lines a splitlines() loop would.
+    Text-mode reads already fold "\\r\\n"/"\\r", so this is usually a no-op.
+    """
+    if _LINE_BREAKS_RE.search(content):
+        return "\n".join(content.splitlines())
+    return content
 
 
 def detect_heading_levels(content: str) -> Tuple[int, int]:
@@ -99,24 +188,34 @@ def detect_heading_levels(content: str) -> Tuple[int, int]:
     This handles epics.md files that have both a summary section (### Epic) and a detailed
     section (## Epic / ### Story) — the story heading level disambiguates.
     """
+    text = _multiline_view(content)
+
     # First, try to detect story level directly — unambiguous when present
-    for line in content.splitlines():
-        m = re.match(r'^(#{1,6})\s+Story\s+\d+\.\d+:', line)
-        if m:
-            story_level = len(m.group(1))
-            return story_level - 1, story_level
+    m = _STORY_LEVEL_RE.search(text)
+    if m:
+        story_level = len(m.group(1))
+        return story_level - 1, story_level
 
     # No stories found; detect from first epic heading
-    for line in content.splitlines():
-        m = re.match(r'^(#{1,6})\s+Epic\s+\d+:', line)
-        if m:
-            epic_level = len(m.group(1))
-            return epic_level, epic_level + 1
+    m = _EPIC_LEVEL_RE.search(text)
+    if m:
+        epic_level = len(m.group(1))
+        return epic_level, epic_level + 1
 
     # Defaults: ## Epic, ### Story
     return 2, 3
 
 
+@functools.lru_cache(maxsize=8)
+def _make_heading_res(epic_level: int, story_level: int) -> Tuple[Pattern, Pattern, Pattern]:
+    """Compile the Epic heading, Story heading and story-boundary patterns for the detected levels."""
+    epic_re = re.compile(rf'^{re.escape("#" * epic_level)}\s+Epic\s+(\d+):\s*(.+)$')
+    story_re = re.compile(rf'^{re.escape("#" * story_level)}\s+Story\s+(\d+\.\d+):\s*(.+)$')
+    # Any heading at story level or deeper ends an epic's own content
+    story_boundary_re = re.compile(rf'^#{{{story_level},}}\s+')
+    return epic_re, story_re, story_boundary_re
+
+
 def parse_epics_file(path: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Parse epics.md, auto-detecting heading levels."""
     if not os.path.isfile(path):
@@ -128,164 +227,117 @@ def parse_epics_file(path: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, An
 
     epic_level, story_level = detect_heading_levels(content)
 
-    epic_prefix = "#" * epic_level
-    story_prefix = "#" * story_level
-
-    epic_pattern = re.compile(
-        rf'^{re.escape(epic_prefix)}\s+Epic\s+(\d+):\s*(.+)$', re.MULTILINE
-    )
-    story_pattern = re.compile(
-        rf'^{re.escape(story_prefix)}\s+Story\s+(\d+\.\d+):\s*(.+)$', re.MULTILINE
-    )
-
-    # Also match any heading at epic level or above as section boundary
-    any_heading_at_epic = re.compile(
-        rf'^#{{{1},{epic_level}}}\s+', re.MULTILINE
-    )
+    epic_re, story_re, story_boundary_re = _make_heading_res(epic_level, story_level)
 
-    lines = content.splitlines()
     epics = []
     stories = []
 
-    # Find all epic and story positions
-    epic_positions = []
-    story_positions = []
-
-    for i, line in enumerate(lines):
-        em = re.match(rf'^{re.escape(epic_prefix)}\s+Epic\s+(\d+):\s*(.+)$', line)
-        if em:
-            epic_positions.append((i, em.group(1), em.group(2)))
-        sm = re.match(rf'^{re.escape(story_prefix)}\s+Story\s+(\d+\.\d+):\s*(.+)$', line)
-        if sm:
-            story_positions.append((i, sm.group(1), sm.group(2)))
-
-    # Parse epics with their content
-    for idx, (line_num, epic_id, epic_title) in enumerate(epic_positions):
-        # Content runs until next epic heading or end of file
-        if idx + 1 < len(epic_positions):
-            end_line = epic_positions[idx + 1][0]
-        else:
-            end_line = len(lines)
+    # Single pass: headings open a section, other lines feed whichever
+    # section is currently collecting content. Only lines starting with the
+    # epic prefix can be Epic/Story headings (stories sit one level deeper).
+    epic_prefix = "#" * epic_level
+    epic_sections = []
+    story_sections = []
+    epic = None   # epic currently collecting content lines
+    story = None  # story currently collecting content lines
 
-        content_lines = lines[line_num + 1:end_line]
-        description_parts = []
-        phase = ""
-        requirements = []
-        dependencies = []
+    for line in content.splitlines():
+        if line.startswith(epic_prefix):
+            em = epic_re.match(line)
+            if em:
+                epic = {"id": em.group(1), "title": em.group(2), "description": [],
+                        "phase": "", "requirements": [], "dependencies": []}
+                epic_sections.append(epic)
+                story = None
+                continue
+            sm = story_re.match(line)
+            if sm:
+                story = {"id": sm.group(1), "title": sm.group(2), "inAc": False,
+                         "ac": [], "description": [], "requirements": []}
+                story_sections.append(story)
+                epic = None
+                continue
 
-        for cl in content_lines:
-            # Skip story headings and deeper - they belong to stories
-            if re.match(rf'^#{{{story_level},}}\s+', cl):
-                break
+        if epic is not None:
+            # Story headings and deeper end the epic's own content
+            if story_boundary_re.match(line):
+                epic = None
+                continue
 
             # Extract phase
-            pm = re.match(r'^\*\*(?:Target\s+)?Phase:\*\*\s*(.+)', cl, re.IGNORECASE)
+            pm = _PHASE_RE.match(line)
             if pm:
-                phase = pm.group(1).strip()
+                epic["phase"] = pm.group(1).strip()
                 continue
 
             # Extract dependencies
-            dm = re.match(r'^\*\*Depend(?:s on|encies):\*\*\s*(.+)', cl, re.IGNORECASE)
+            dm = _DEPS_RE.match(line)
             if dm:
                 deps_text = dm.group(1).strip()
-                dependencies = [d.strip() for d in re.split(r'[,;]', deps_text) if d.strip()]
+                epic["dependencies"] = [d.strip() for d in _DEPS_SPLIT_RE.split(deps_text) if d.strip()]
                 continue
 
             # Extract requirement references
-            refs = re.findall(r'(?:FR|NFR|ARCH)-[\w.]+', cl)
+            refs = _REQ_RE.findall(line)
             if refs:
-                requirements.extend(refs)
+                epic["requirements"].extend(refs)
 
             # Description lines (non-empty, non-metadata)
-            stripped = cl.strip()
-            if stripped and not stripped.startswith("**") and not re.match(rf'^#{{{1},}}\s+', cl):
-                description_parts.append(stripped)
-
-        # Deduplicate requirements
-        requirements = sorted(set(requirements))
-
-        epics.append({
-            "id": epic_id,
-            "title": epic_title.strip(),
-            "description": "\n".join(description_parts).strip(),
-            "phase": phase,
-            "requirements": requirements,
-            "dependencies": dependencies
-        })
+            stripped = line.strip()
+            if stripped and not stripped.startswith("**") and not _ANY_HEADING_RE.match(line):
+                epic["description"].append(stripped)
 
-    # Deduplicate epics by ID — some epics.md files have both a summary section
-    # and a detailed section with the same Epic headings. Keep first occurrence.
-    seen_epic_ids = set()
-    unique_epics = []
-    for epic in epics:
-        if epic["id"] not in seen_epic_ids:
-            seen_epic_ids.add(epic["id"])
-            unique_epics.append(epic)
-    epics = unique_epics
-
-    # Parse stories with their content
-    for idx, (line_num, story_id, story_title) in enumerate(story_positions):
-        # Determine parent epic
-        epic_id = story_id.split(".")[0]
-
-        # Content runs until next story heading or next epic heading or end
-        end_line = len(lines)
-        for next_pos in story_positions[idx + 1:]:
-            end_line = next_pos[0]
-            break
-        # Also check next epic
-        for ep_pos in epic_positions:
-            if ep_pos[0] > line_num and ep_pos[0] < end_line:
-                end_line = ep_pos[0]
-                break
-
-        content_lines = lines[line_num + 1:end_line]
-
-        user_story_text = ""
-        acceptance_criteria = ""
-        requirements = []
-        in_ac = False
-        ac_lines = []
-        desc_lines = []
-
-        for cl in content_lines:
+        elif story is not None:
             # Check for AC header
-            if re.match(r'^\*\*Acceptance Criteria:\*\*|^#{1,6}\s+Acceptance Criteria', cl):
-                in_ac = True
+            if _AC_HEADER_RE.match(line):
+                story["inAc"] = True
                 continue
 
             # Check for end of AC block (new bold section or higher heading)
-            if in_ac:
-                if re.match(r'^#{1,6}\s+', cl) and not re.match(r'^#{1,6}\s+Acceptance Criteria', cl):
-                    in_ac = False
-                elif re.match(r'^\*\*[^*]+:\*\*', cl) and not re.match(r'^\*\*Acceptance Criteria:\*\*', cl):
-                    in_ac = False
+            if story["inAc"]:
+                if _HEADING_RE.match(line) and not _AC_HEADING_RE.match(line):
+                    story["inAc"] = False
+                elif _BOLD_LABEL_RE.match(line) and not _AC_BOLD_RE.match(line):
+                    story["inAc"] = False
                 else:
-                    ac_lines.append(cl)
+                    story["ac"].append(line)
                     continue
 
             # Extract requirement references
-            refs = re.findall(r'(?:FR|NFR|ARCH)-[\w.]+', cl)
+            refs = _REQ_RE.findall(line)
             if refs:
-                requirements.extend(refs)
+                story["requirements"].extend(refs)
 
             # Description lines
-            stripped = cl.strip()
-            if stripped and not re.match(r'^#{1,6}\s+', cl):
-                desc_lines.append(stripped)
+            stripped = line.strip()
+            if stripped and not _HEADING_RE.match(line):
+                story["description"].append(stripped)
 
-        # First paragraph is typically the user story text
-        user_story_text = "\n".join(desc_lines).strip()
-        acceptance_criteria = "\n".join(ac_lines).strip()
-        requirements = sorted(set(requirements))
+    # Deduplicate epics by ID — some epics.md files have both a summary section
+    # and a detailed section with the same Epic headings. Keep first occurrence.
+    unique_epics = {}
+    for section in epic_sections:
+        unique_epics.setdefault(section["id"], section)
+    for section in unique_epics.values():
+        epics.append({
+            "id": section["id"],
+            "title": section["title"].strip(),
+            "description": "\n".join(section["description"]).strip(),
+            "phase": section["phase"],
+            "requirements": sorted(set(section["requirements"])),
+            "dependencies": section["dependencies"]
+        })
 
+    for section in story_sections:
+        story_id = section["id"]
         stories.append({
             "id": story_id,
-            "epicId": epic_id,
-            "title": story_title.strip(),
-            "userStoryText": user_story_text,
-            "acceptanceCriteria": acceptance_criteria,
-            "requirements": requirements
+            "epicId": story_id.split(".")[0],
+            "title": section["title"].strip(),
+            # First paragraph is typically the user story text
+            "userStoryText": "\n".join(section["description"]).strip(),
+            "acceptanceCriteria": "\n".join(section["ac"]).strip(),
+            "requirements": sorted(set(section["requirements"]))
         })
 
     return epics, stories
@@ -309,98 +361,97 @@ def parse_story_file(story_id: str, story_path: str) -> Tuple[List[Dict[str, Any
     with open(story_path, "r", encoding="utf-8") as f:
         content = f.read()
 
-    lines = content.splitlines()
-
-    # --- Extract Status field ---
-    for line in lines:
-        sm = re.match(r'^\*?\*?Status:\*?\*?\s*(.+)$', line, re.IGNORECASE)
-        if sm:
-            status = sm.group(1).strip().lower()
-            break
-
-    # --- Extract Tasks ---
     in_tasks = False
+    tasks_done = False
     task_num = 0
     current_task_num = 0
-
-    for line in lines:
-        # Detect Tasks section header
-        if re.match(r'^##\s+Tasks\s*/?\s*Subtasks', line, re.IGNORECASE):
-            in_tasks = True
-            continue
-
-        # End of tasks section on next heading (## or deeper)
-        if in_tasks and re.match(r'^#{2,}\s+', line) and not re.match(r'^#{2,}\s+Tasks', line, re.IGNORECASE):
-            break
-
-        if not in_tasks:
-            continue
-
-        # Top-level task: "- [ ] description" or "- [x] description"
-        tm = re.match(r'^- \[([ xX])\]\s*(.+)$', line)
-        if tm:
-            task_num += 1
-            current_task_num = task_num
-            tasks.append({
-                "id": f"{story_id}-T{task_num}",
-                "description": tm.group(2).strip(),
-                "complete": tm.group(1).lower() == "x",
-                "subtasks": []
-            })
-            continue
-
-        # Subtask: indented "- [ ] description"
-        sm = re.match(r'^\s{2,}- \[([ xX])\]\s*(.+)$', line)
-        if sm and tasks:
-            subtask_num = len(tasks[-1]["subtasks"]) + 1
-            tasks[-1]["subtasks"].append({
-                "id": f"{story_id}-T{current_task_num}.{subtask_num}",
-                "description": sm.group(2).strip(),
-                "complete": sm.group(1).lower() == "x"
-            })
-
-    # --- Extract Review Follow-ups ---
-    review_header_re = re.compile(
-        r'^###\s+Review Follow-ups(?:\s+Round\s+(\d+))?\s*\(AI\)\s*$', re.IGNORECASE
-    )
     current_round = 0
     in_review = False
     item_num = 0
 
-    for line in lines:
-        hm = review_header_re.match(line)
-        if hm:
-            current_round = int(hm.group(1)) if hm.group(1) else 1
-            in_review = True
-            item_num = 0
+    # --- Status field (first match wins) ---
+    # Interned: the handful of status values repeat across every story
+    text = _multiline_view(content)
+    sm = _STATUS_RE.search(text)
+    if sm:
+        status = sys.intern(sm.group(1).strip().lower())
+
+    # Single pass over the file. The master pattern only yields the lines
+    # that can matter (## headings, task items, indented subtask items), so
+    # prose never reaches Python. The Tasks section and the review
+    # follow-up sections are tracked independently.
+    for lm in _STORY_LINE_RE.finditer(text):
+        kind = lm.lastgroup
+        line = lm.group()
+
+        if kind == "heading":
+            # Tasks section header; the section ends on the next heading
+            # (## or deeper) that isn't itself a Tasks heading.
+            if not tasks_done:
+                if _TASKS_HEADER_RE.match(line):
+                    in_tasks = True
+                elif in_tasks and _SUBHEADING_RE.match(line) and not _TASKS_HEADING_RE.match(line):
+                    in_tasks = False
+                    tasks_done = True
+
+            # Review section header; the section ends on the next heading at
+            # ## or ### level that isn't another review header.
+            hm = _REVIEW_HEADER_RE.match(line)
+            if hm:
+                current_round = int(hm.group(1)) if hm.group(1) else 1
+                in_review = True
+                item_num = 0
+            elif in_review and _SECTION_HEADING_RE.match(line):
+                in_review = False
             continue
 
-        # End of review section on next heading at ## or ### level (that isn't another review header)
-        if in_review and re.match(r'^##\s+', line) and not review_header_re.match(line):
-            in_review = False
-            continue
+        if kind == "task":
+            if not (in_tasks or in_review):
+                continue
+            tm = _TASK_RE.match(line)
+            if not tm:
+                continue
 
-        if not in_review:
+            # Top-level task: "- [ ] description" or "- [x] description"
+            if in_tasks:
+                task_num += 1
+                current_task_num = task_num
+                tasks.append({
+                    "id": f"{story_id}-T{task_num}",
+                    "description": tm.group(2).strip(),
+                    "complete": tm.group(1).lower() == "x",
+                    "subtasks": []
+                })
+
+            # Review item: "- [ ] description" or "- [x] description"
+            if in_review:
+                item_num += 1
+                desc = tm.group(2).strip()
+                meta = extract_review_metadata(desc)
+                review_tasks.append({
+                    "id": f"{story_id}-R{current_round}.{item_num}",
+                    "description": desc,
+                    "complete": tm.group(1).lower() == "x",
+                    "isReviewFollowup": True,
+                    "reviewRound": current_round,
+                    "subtasks": [],
+                    "cleanTitle": meta["cleanTitle"],
+                    "priority": meta["priority"],
+                    "filePath": meta["filePath"],
+                    "tags": meta["tags"]
+                })
             continue
 
-        # Review item: "- [ ] description" or "- [x] description"
-        rm = re.match(r'^- \[([ xX])\]\s*(.+)$', line)
-        if rm:
-            item_num += 1
-            desc = rm.group(2).strip()
-            meta = extract_review_metadata(desc)
-            review_tasks.append({
-                "id": f"{story_id}-R{current_round}.{item_num}",
-                "description": desc,
-                "complete": rm.group(1).lower() == "x",
-                "isReviewFollowup": True,
-                "reviewRound": current_round,
-                "subtasks": [],
-                "cleanTitle": meta["cleanTitle"],
-                "priority": meta["priority"],
-                "filePath": meta["filePath"],
-                "tags": meta["tags"]
-            })
+        # Subtask: indented "- [ ] description"
+        if in_tasks and tasks:
+            sm = _SUBTASK_RE.match(line)
+            if sm:
+                subtask_num = len(tasks[-1]["subtasks"]) + 1
+                tasks[-1]["subtasks"].append({
+                    "id": f"{story_id}-T{current_task_num}.{subtask_num}",
+                    "description": sm.group(2).strip(),
+                    "complete": sm.group(1).lower() == "x"
+                })
 
     # --- Enrich regular tasks with AC references and subtask HTML ---
     for task in tasks:
@@ -415,10 +466,19 @@ def story_id_from_filename(filename: str) -> Optional[str]:
 
     Example: '1-1-initialize-solution-scaffold.md' -> '1.1'
     """
-    m = re.match(r'^(\d+)-(\d+)-', filename)
+    m = _FILENAME_RE.match(filename)
     return f"{m.group(1)}.{m.group(2)}" if m else None
 
 
+def _parse_story_work_item(item: Tuple[str, str]) -> Optional[Tuple[List[Dict[str, Any]], Optional[str], List[Dict[str, Any]]]]:
+    """Parse one (story_id, path) work item; None if the file can't be read."""
+    story_id, story_path = item
+    try:
+        return parse_story_file(story_id, story_path)
+    except OSError:
+        return None
+
+
 def scan_story_files(stories_dir: str, story_ids: List[str]) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str], Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
     """Scan story directories and flat files for task breakdowns, statuses, and review follow-ups.
 
@@ -426,6 +486,9 @@ def scan_story_files(stories_dir: str, story_ids: List[str]) -> Tuple[Dict[str,
     1. Known story IDs in nested {N.M}/story.md format (backward compat)
     2. Flat {N-M-slug}.md files — skip IDs already found in pass 1
     3. Unknown nested directories matching ^\\d+\\.\\d+$
+
+    The passes only locate files; the located files are then parsed on a small
+    thread pool and merged in discovery order, so output order is unchanged.
     """
     all_tasks = {}
     story_statuses = {}
@@ -436,62 +499,74 @@ def scan_story_files(stories_dir: str, story_ids: List[str]) -> Tuple[Dict[str,
         return all_tasks, story_statuses, review_followups_by_story, story_file_paths
 
     found_ids = set()
+    work = []
+
+    # All passes share one directory listing; DirEntry caches the file
+    # type from the scan, so most entries need no extra stat call.
+    try:
+        with os.scandir(stories_dir) as it:
+            entries = list(it)
+        nested_dirs = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        # Unlistable (e.g. execute-only) directory: probe each known ID
+        entries = []
+        nested_dirs = None
 
     # Pass 1: Known story IDs in nested {N.M}/story.md format
     for story_id in story_ids:
+        if story_id in found_ids:
+            continue
+        if nested_dirs is not None and story_id not in nested_dirs:
+            continue
         story_path = os.path.join(stories_dir, story_id, "story.md")
         if os.path.isfile(story_path):
-            tasks, status, review_tasks = parse_story_file(story_id, story_path)
-            if tasks:
-                all_tasks[story_id] = tasks
-            if status:
-                story_statuses[story_id] = status
-            if review_tasks:
-                review_followups_by_story[story_id] = review_tasks
-            story_file_paths[story_id] = os.path.abspath(story_path)
+            work.append((story_id, story_path))
             found_ids.add(story_id)
 
     # Pass 2: Flat {N-M-slug}.md files — skip IDs already found
     try:
-        for entry in os.listdir(stories_dir):
-            if not entry.endswith(".md"):
+        for entry in entries:
+            if not entry.name.endswith(".md"):
                 continue
-            sid = story_id_from_filename(entry)
+            sid = story_id_from_filename(entry.name)
             if not sid or sid in found_ids:
                 continue
-            story_path = os.path.join(stories_dir, entry)
-            if os.path.isfile(story_path):
-                tasks, status, review_tasks = parse_story_file(sid, story_path)
-                if tasks:
-                    all_tasks[sid] = tasks
-                if status:
-                    story_statuses[sid] = status
-                if review_tasks:
-                    review_followups_by_story[sid] = review_tasks
-                story_file_paths[sid] = os.path.abspath(story_path)
+            if entry.is_file():
+                work.append((sid, entry.path))
                 found_ids.add(sid)
     except OSError:
         pass
 
     # Pass 3: Unknown nested directories matching ^\d+\.\d+$
     try:
-        for entry in os.listdir(stories_dir):
-            entry_path = os.path.join(stories_dir, entry)
-            if os.path.isdir(entry_path) and re.match(r'^\d+\.\d+$', entry) and entry not in found_ids:
-                story_path = os.path.join(entry_path, "story.md")
+        for entry in entries:
+            name = entry.name
+            if _STORY_DIR_RE.match(name) and name not in found_ids and entry.is_dir():
+                story_path = os.path.join(entry.path, "story.md")
                 if os.path.isfile(story_path):
-                    tasks, status, review_tasks = parse_story_file(entry, story_path)
-                    if tasks:
-                        all_tasks[entry] = tasks
-                    if status:
-                        story_statuses[entry] = status
-                    if review_tasks:
-                        review_followups_by_story[entry] = review_tasks
-                    story_file_paths[entry] = os.path.abspath(story_path)
-                    found_ids.add(entry)
+                    work.append((name, story_path))
+                    found_ids.add(name)
     except OSError:
         pass
 
+    if len(work) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(work), _MAX_PARSE_WORKERS)) as pool:
+            results = list(pool.map(_parse_story_work_item, work))
+    else:
+        results = [_parse_story_work_item(item) for item in work]
+
+    for (story_id, story_path), parsed in zip(work, results):
+        if parsed is None:
+            continue
+        tasks, status, review_tasks = parsed
+        if tasks:
+            all_tasks[story_id] = tasks
+        if status:
+            story_statuses[story_id] = status
+        if review_tasks:
+            review_followups_by_story[story_id] = review_tasks
+        story_file_paths[story_id] = os.path.abspath(story_path)
+
     return all_tasks, story_statuses, review_followups_by_story, story_file_paths
 
 
@@ -503,26 +578,58 @@ def parse_epic_statuses(path: str) -> Dict[str, str]:
     if not path or not os.path.isfile(path):
         return {}
 
-    with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
-
     in_dev_status = False
     epic_statuses = {}
 
-    for line in content.splitlines():
-        if re.match(r'^development_status:\s*$', line):
-            in_dev_status = True
-            continue
-        if in_dev_status:
-            if line and not line[0].isspace():
-                break
-            m = re.match(r'^\s+epic-(\d+):\s*(\S+)\s*$', line)
-            if m:
-                epic_statuses[m.group(1)] = m.group(2).strip().lower()
+    # Stream the file: reading stops at the end of the development_status
+    # block instead of loading and splitting the whole sprint file.
+    # Lines keep their trailing newline, which the patterns' \s* absorbs.
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("development_status:") and _DEV_STATUS_RE.match(line):
+                in_dev_status = True
+                continue
+            if in_dev_status:
+                if line and not line[0].isspace():
+                    break
+                if line.lstrip().startswith("epic-"):
+                    m = _EPIC_STATUS_RE.match(line)
+                    if m:
+                        epic_statuses[m.group(1)] = sys.intern(m.group(2).strip().lower())
 
     return epic_statuses
 
 
+def _flatten_by_story(tasks_by_story: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Tag each task with its storyId and flatten, ordered by story ID."""
+    flat = []
+    for story_id, task_list in tasks_by_story.items():
+        for task in task_list:
+            task["storyId"] = story_id
+        flat.extend(task_list)
+    flat.sort(key=_STORY_ID_KEY)
+    return flat
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write data in one call to a temp file, then os.replace() it into place.
+
+    Readers (compute-hashes.py) never see a half-written file, even if the
+    run is interrupted mid-write.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Parse BMAD artifacts (epics, stories, tasks, epic statuses) into structured JSON"
@@ -531,6 +638,7 @@ def main():
     parser.add_argument("--stories-dir", default="", help="Path to implementation artifacts directory")
     parser.add_argument("--sprint-yaml", default="", help="Path to sprint-status.yaml")
     parser.add_argument("--output", required=True, help="Path to write output JSON")
+    parser.add_argument("--quiet", action="store_true", help="Print only the counts to stdout instead of the full JSON")
     args = parser.parse_args()
 
     # Parse epics.md
@@ -540,17 +648,12 @@ def main():
     story_ids = [s["id"] for s in stories]
     tasks_by_story, story_statuses, review_followups_by_story, story_file_paths = scan_story_files(args.stories_dir, story_ids)
 
-    # Flatten tasks
-    all_tasks = []
-    for story_id, task_list in sorted(tasks_by_story.items()):
-        for task in task_list:
-            all_tasks.append({**task, "storyId": story_id})
+    # Flatten tasks; a stable sort on storyId groups them by story while
+    # keeping file order within each story
+    all_tasks = _flatten_by_story(tasks_by_story)
 
     # Flatten review follow-up tasks and merge into all_tasks
-    all_review_tasks = []
-    for story_id, review_list in sorted(review_followups_by_story.items()):
-        for task in review_list:
-            all_review_tasks.append({**task, "storyId": story_id})
+    all_review_tasks = _flatten_by_story(review_followups_by_story)
     all_tasks.extend(all_review_tasks)
 
     # Parse epic statuses from sprint-status.yaml
@@ -574,14 +677,19 @@ def main():
         }
     }
 
+    # Serialize once; the same payload goes to the output file and stdout
+    payload = json.dumps(result, indent=2)
+
     # Write output
     output_path = args.output
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2)
+    _write_atomic(output_path, payload.encode("utf-8"))
 
-    # Also print to stdout for visibility
-    print(json.dumps(result, indent=2))
+    # Also print to stdout for visibility; --quiet skips the full copy
+    if args.quiet:
+        print(json.dumps(result["counts"]))
+    else:
+        print(payload)
 
 
 if __name__ == "__main__":
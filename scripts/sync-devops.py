@@ -1,20 +1,49 @@
 #!/usr/bin/env python3
-"""Batch Azure DevOps sync via az CLI with error resilience.
+"""Batch Azure DevOps sync via REST or az CLI with error resilience.
 
-Cross-platform, stdlib-only. Auto-detects az executable path.
+Cross-platform, stdlib-only. Auto-detects az executable path. Work item
+calls go over a persistent REST connection by default (--transport rest)
+and fall back to one az process per call (--transport az).
 Creates/updates work items in dependency order (Epics -> Stories -> Tasks -> Iterations).
 """
 
 import argparse
 import base64
+import functools
+import http.client
 import json
 import os
+import random
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+_API_VERSION = "7.0"
+_BATCH_SIZE = 200  # Azure DevOps $batch accepts at most 200 requests per call
+
+
+_CONFIG_LINE_RE = re.compile(r'^[ \t]*(\w+):[ \t]*"?([^"\n]*)"?[ \t]*$', re.MULTILINE)
+
+
+def load_config(path: str) -> Dict[str, str]:
+    """Load devops-sync-config.yaml (flat `key: "value"` lines) into a dict.
+
+    Simple line parser, no PyYAML: one regex scan over the whole file picks
+    out `key: value` lines (comments and blank lines never match), and
+    optional double quotes around values are stripped.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    return {m.group(1): m.group(2).strip() for m in _CONFIG_LINE_RE.finditer(text)}
 
 
 def find_az_executable() -> str:
@@ -30,42 +59,138 @@ def find_az_executable() -> str:
     return "az"
 
 
+@functools.lru_cache(maxsize=None)
+def _az_launcher(az_path: str) -> Tuple[Tuple[str, ...], bool]:
+    """Resolve how to launch az. Returns (command prefix, needs shell).
+
+    On Windows az is az.cmd, a batch wrapper that sets AZ_INSTALLER=MSI
+    and runs the bundled interpreter as `python.exe -IBm azure.cli` (run_az
+    sets the same variable through _az_env). Even without shell=True,
+    Windows routes batch files through cmd.exe, so calling that interpreter
+    directly is the only way to skip cmd.exe's quoting rules and its
+    8191-char command line limit (CreateProcess allows 32767). Falls back to
+    the shell when the interpreter is not next to the installed az.cmd.
+    """
+    if sys.platform != "win32":
+        return (az_path,), False
+    if az_path.lower().endswith(".cmd"):
+        python = os.path.normpath(os.path.join(os.path.dirname(az_path), "..", "python.exe"))
+        if os.path.isfile(python):
+            return (python, "-IBm", "azure.cli"), False
+    return (az_path,), True
+
+
+# Argument values longer than this are handed to az as @file references
+# (az reads any "@<path>" value from that file), so descriptions never
+# count against the command line limit and need no truncation. Kept well
+# under half of cmd.exe's 8191 chars so the shell fallback stays safe too.
+_AZ_INLINE_MAX = 2000
+
+# Characters cmd.exe mangles even inside double quotes: %VAR% is expanded
+# and a line break ends the command
+_SHELL_UNSAFE_RE = re.compile(r"[%\r\n]")
+
+
+def _spill_long_args(args: List[str], shell: bool = False) -> Tuple[List[str], List[str]]:
+    """Replace oversized argument values with @file references.
+
+    With shell=True (the cmd.exe fallback), values cmd.exe would mangle
+    are spilled too. Returns (args, temp file paths); the caller deletes
+    the files.
+    """
+    out = []
+    paths = []
+    for a in args:
+        if len(a) > _AZ_INLINE_MAX or (shell and _SHELL_UNSAFE_RE.search(a)):
+            # Binary, so line breaks reach az byte for byte (text mode
+            # would turn \n into \r\n on Windows)
+            with tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False) as f:
+                f.write(a.encode("utf-8"))
+            paths.append(f.name)
+            a = "@" + f.name
+        out.append(a)
+    return out, paths
+
+
+# Settings that trim az's per-process overhead: no telemetry upload
+# process spawned on exit, no survey prompt. Values the user already
+# set in the environment win.
+_AZ_ENV_DEFAULTS = {
+    "AZURE_CORE_COLLECT_TELEMETRY": "no",
+    "AZURE_CORE_SURVEY_MESSAGE": "no",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _az_env(bundled_python: bool = False) -> Dict[str, str]:
+    """Environment for az subprocesses, built once per run.
+
+    With bundled_python (az.cmd's interpreter launched directly), also sets
+    the AZ_INSTALLER=MSI that az.cmd itself would have set.
+    """
+    env = dict(os.environ)
+    for key, value in _AZ_ENV_DEFAULTS.items():
+        env.setdefault(key, value)
+    if bundled_python:
+        env.setdefault("AZ_INSTALLER", "MSI")
+    return env
+
+
+# Bulkhead for az subprocesses: each one loads the whole Azure CLI
+# (~200 MB RSS), so only this many run at once however many workers sync.
+# REST calls are not gated; --max-workers already bounds them.
+_AZ_SEMAPHORE = threading.BoundedSemaphore(os.cpu_count() or 4)
+
+
+def set_az_concurrency(limit: int) -> None:
+    """Cap the number of az subprocesses that may run at the same time."""
+    global _AZ_SEMAPHORE
+    _AZ_SEMAPHORE = threading.BoundedSemaphore(limit)
+
+
 def run_az(az_path: str, args: List[str], timeout: int = 120) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """Run an az CLI command and return parsed JSON or error."""
-    cmd = [az_path] + args + ["--output", "json"]
+    prefix, use_shell = _az_launcher(az_path)
+    args, spilled = _spill_long_args(args, shell=use_shell)
+    cmd = list(prefix) + args + ["--output", "json"]
 
     try:
-        if sys.platform == "win32":
-            # On Windows, az.cmd requires shell execution. Python's list2cmdline
-            # doesn't quote args that lack spaces, but HTML descriptions like
-            # <div>text</div> contain <> which cmd.exe interprets as redirects.
-            # Build a command string where every arg is individually double-quoted.
-            quoted = []
-            for a in cmd:
-                # Escape any internal double-quotes for cmd.exe (use "")
-                a_escaped = a.replace('"', '""')
-                quoted.append(f'"{a_escaped}"')
-            cmd_str = " ".join(quoted)
-            result = subprocess.run(
-                cmd_str,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                shell=True
-            )
-        else:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+        with _AZ_SEMAPHORE:
+            if use_shell:
+                # az.cmd through cmd.exe. Python's list2cmdline doesn't quote args
+                # that lack spaces, but HTML descriptions like <div>text</div>
+                # contain <> which cmd.exe interprets as redirects.
+                # Build a command string where every arg is individually double-quoted.
+                quoted = []
+                for a in cmd:
+                    # Escape any internal double-quotes for cmd.exe (use "")
+                    a_escaped = a.replace('"', '""')
+                    quoted.append(f'"{a_escaped}"')
+                cmd_str = " ".join(quoted)
+                result = subprocess.run(
+                    cmd_str,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    shell=True,
+                    env=_az_env()
+                )
+            else:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    env=_az_env(len(prefix) > 1)
+                )
 
         if result.returncode != 0:
             error_msg = result.stderr.strip() or result.stdout.strip() or f"Exit code {result.returncode}"
             return None, error_msg
 
-        if result.stdout.strip():
+        # isspace() answers "anything but whitespace?" without the
+        # full-size copy strip() would make of a large response
+        if result.stdout and not result.stdout.isspace():
             try:
                 return json.loads(result.stdout), None
             except json.JSONDecodeError:
@@ -78,17 +203,41 @@ def run_az(az_path: str, args: List[str], timeout: int = 120) -> Tuple[Optional[
         return None, f"az CLI not found at: {az_path}"
     except Exception as e:
         return None, str(e)
+    finally:
+        for path in spilled:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_STORY_TYPES = {
+    "Agile": "User Story",
+    "Scrum": "Product Backlog Item",
+    "CMMI": "Requirement",
+    "Basic": "Issue"
+}
+
+_COMPLETE_STATES = {
+    "Agile": "Closed",
+    "Scrum": "Done",
+    "CMMI": "Resolved",
+    "Basic": "Done"
+}
+
+# BMAD status -> process template -> Azure DevOps state
+_STATUS_MAP = {
+    "draft": {"Agile": "New", "Scrum": "New", "CMMI": "Proposed", "Basic": "To Do"},
+    "backlog": {"Agile": "New", "Scrum": "New", "CMMI": "Proposed", "Basic": "To Do"},
+    "in-progress": {"Agile": "Active", "Scrum": "Committed", "CMMI": "Active", "Basic": "Doing"},
+    "review": {"Agile": "Active", "Scrum": "Committed", "CMMI": "Active", "Basic": "Doing"},
+    "done": {"Agile": "Closed", "Scrum": "Done", "CMMI": "Resolved", "Basic": "Done"},
+}
 
 
 def get_story_type(template: str) -> str:
     """Map process template to story work item type."""
-    mapping = {
-        "Agile": "User Story",
-        "Scrum": "Product Backlog Item",
-        "CMMI": "Requirement",
-        "Basic": "Issue"
-    }
-    return mapping.get(template, "User Story")
+    return _STORY_TYPES.get(template, "User Story")
 
 
 def get_ac_field(template: str) -> Optional[str]:
@@ -100,15 +249,10 @@ def get_ac_field(template: str) -> Optional[str]:
 
 def get_complete_state(template: str) -> str:
     """Map process template to complete state name."""
-    mapping = {
-        "Agile": "Closed",
-        "Scrum": "Done",
-        "CMMI": "Resolved",
-        "Basic": "Done"
-    }
-    return mapping.get(template, "Done")
+    return _COMPLETE_STATES.get(template, "Done")
 
 
+@functools.lru_cache(maxsize=256)
 def map_bmad_status_to_devops_state(status: Optional[str], template: str) -> Optional[str]:
     """Map BMAD status to Azure DevOps work item state.
 
@@ -123,21 +267,14 @@ def map_bmad_status_to_devops_state(status: Optional[str], template: str) -> Opt
     | review       | Active | Committed | Active   | Doing |
     | done         | Closed | Done      | Resolved | Done  |
     | (not set)    | None   | None      | None     | None  |
+
+    Cached: a run sees only a handful of distinct statuses, but maps one per
+    work item.
     """
     if not status:
         return None
 
-    status = status.strip().lower()
-
-    mapping = {
-        "draft": {"Agile": "New", "Scrum": "New", "CMMI": "Proposed", "Basic": "To Do"},
-        "backlog": {"Agile": "New", "Scrum": "New", "CMMI": "Proposed", "Basic": "To Do"},
-        "in-progress": {"Agile": "Active", "Scrum": "Committed", "CMMI": "Active", "Basic": "Doing"},
-        "review": {"Agile": "Active", "Scrum": "Committed", "CMMI": "Active", "Basic": "Doing"},
-        "done": {"Agile": "Closed", "Scrum": "Done", "CMMI": "Resolved", "Basic": "Done"},
-    }
-
-    status_map = mapping.get(status)
+    status_map = _STATUS_MAP.get(status.strip().lower())
     if not status_map:
         return None
     return status_map.get(template)
@@ -150,22 +287,56 @@ def truncate_title(text: str, max_len: int = 255) -> str:
     return text[:max_len - 3].rstrip() + "..."
 
 
+def _escape_html(text: str) -> str:
+    """Escape &, < and > for Azure DevOps HTML fields.
+
+    A str.replace chain beats str.translate here: translate with
+    multi-character replacements is several times slower on markup-heavy
+    text. Plain text, the common case, skips the chain entirely: `in`
+    checks scan several times faster than a replace that finds nothing.
+    """
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+@functools.lru_cache(maxsize=4096)
 def wrap_html(text: Optional[str], max_len: int = 0) -> str:
     """Wrap plain text in a div for Azure DevOps HTML fields.
 
-    If max_len > 0, truncate the text before escaping to stay within CLI limits.
-    On Windows cmd.exe has an 8191-char command line limit; large descriptions
-    or acceptance criteria can exceed this.
+    If max_len > 0, truncate the text before escaping. The sync itself passes
+    full content: REST bodies have no length limit and run_az hands long
+    values to az as @file references. Cached, since boilerplate descriptions
+    repeat across work items.
     """
     if not text:
         return ""
     if max_len > 0 and len(text) > max_len:
         text = text[:max_len].rstrip() + "\n\n(truncated — full content in BMAD source files)"
-    escaped = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-    escaped = escaped.replace("\n", "<br>")
+    escaped = _escape_html(text)
+    if "\n" in escaped:
+        escaped = escaped.replace("\n", "<br>")
     return f"<div>{escaped}</div>"
 
 
+@functools.lru_cache(maxsize=4096)
+def _task_description(is_followup: bool, file_path: str, ac_refs: Tuple[Any, ...], subtask_html: str) -> str:
+    """Cached body of build_task_description, keyed on the fields it reads."""
+    parts = []
+    if is_followup:
+        if file_path:
+            parts.append(f"<b>File:</b> <code>{_escape_html(file_path)}</code>")
+    else:
+        if ac_refs:
+            ac_str = ", ".join(str(n) for n in ac_refs)
+            parts.append(f"<b>Acceptance Criteria:</b> {ac_str}")
+        if subtask_html:
+            parts.append(subtask_html)
+    if parts:
+        return "<div>" + "<br>".join(parts) + "</div>"
+    return ""
+
+
 def build_task_description(task: Dict[str, Any]) -> str:
     """Build HTML description for a task work item.
 
@@ -173,54 +344,41 @@ def build_task_description(task: Dict[str, Any]) -> str:
     For regular tasks: includes subtask checklist and AC references.
     Returns empty string if no enrichment available.
     """
-    if task.get("isReviewFollowup"):
-        parts = []
-        file_path = task.get("filePath")
-        if file_path:
-            escaped = file_path.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            parts.append(f"<b>File:</b> <code>{escaped}</code>")
-        if parts:
-            return "<div>" + "<br>".join(parts) + "</div>"
-        return ""
-
-    # Regular task
-    parts = []
-    ac_refs = task.get("acReferences", [])
-    if ac_refs:
-        ac_str = ", ".join(str(n) for n in ac_refs)
-        parts.append(f"<b>Acceptance Criteria:</b> {ac_str}")
-    subtask_html = task.get("subtaskHtml", "")
-    if subtask_html:
-        parts.append(subtask_html)
-    if parts:
-        return "<div>" + "<br>".join(parts) + "</div>"
-    return ""
+    return _task_description(
+        bool(task.get("isReviewFollowup")),
+        task.get("filePath") or "",
+        tuple(task.get("acReferences") or ()),
+        task.get("subtaskHtml") or "",
+    )
 
 
-def build_task_create_args(task: Dict[str, Any], area: str, iteration: str) -> List[str]:
-    """Build az CLI args for creating a task work item with enriched fields."""
-    # Use cleanTitle for review tasks, description for regular tasks
+def _task_title(task: Dict[str, Any]) -> str:
+    """Use cleanTitle for review tasks, description for regular tasks."""
     if task.get("isReviewFollowup") and task.get("cleanTitle"):
-        title = task["cleanTitle"]
-    else:
-        title = task.get("description", "")
+        return task["cleanTitle"]
+    return task.get("description", "")
 
-    args = [
-        "boards", "work-item", "create",
-        "--type", "Task",
-        "--title", truncate_title(title),
-    ]
-    if area:
-        args += ["--area", area]
-    if iteration:
-        args += ["--iteration", iteration]
 
-    # Description
+# Fixed leading argv of the per-task az calls
+_TASK_CREATE_HEAD = ("boards", "work-item", "create", "--type", "Task")
+_TASK_UPDATE_HEAD = ("boards", "work-item", "update")
+
+
+def _fields_args(fields: List[str]) -> List[str]:
+    """A single --fields flag carrying every "Field=value" pair, or nothing.
+
+    az keeps only the last --fields flag it is given, so all pairs must
+    share one.
+    """
+    return ["--fields", *fields] if fields else []
+
+
+def _task_extra_args(task: Dict[str, Any], state: str = "") -> List[str]:
+    """The optional --description and --fields args shared by task create and update."""
+    args = []
     desc_html = build_task_description(task)
     if desc_html:
         args += ["--description", desc_html]
-
-    # Fields (priority, tags)
     fields = []
     priority = task.get("priority")
     if priority is not None:
@@ -228,52 +386,182 @@ def build_task_create_args(task: Dict[str, Any], area: str, iteration: str) -> L
     tags = task.get("tags", [])
     if tags:
         fields.append(f"System.Tags={';'.join(tags)}")
-    for field in fields:
-        args += ["--fields", field]
+    if state:
+        fields.append(f"System.State={state}")
+    return args + _fields_args(fields)
 
-    return args
+
+def build_task_create_args(task: Dict[str, Any], area: str, iteration: str, complete_state: str = "") -> List[str]:
+    """Build az CLI args for creating a task work item with enriched fields.
+
+    With complete_state, a complete task is created directly in that state
+    instead of needing a follow-up update.
+    """
+    args = [*_TASK_CREATE_HEAD, "--title", truncate_title(_task_title(task))]
+    if area:
+        args += ["--area", area]
+    if iteration:
+        args += ["--iteration", iteration]
+    state = complete_state if complete_state and task.get("complete", False) else ""
+    return args + _task_extra_args(task, state)
 
 
 def build_task_update_args(task: Dict[str, Any], devops_id: int, complete_state: str) -> List[str]:
     """Build az CLI args for updating a task work item with enriched fields."""
     state = complete_state if task.get("complete", False) else "New"
-
-    # Use cleanTitle for review tasks, description for regular tasks
-    if task.get("isReviewFollowup") and task.get("cleanTitle"):
-        title = task["cleanTitle"]
-    else:
-        title = task.get("description", "")
-
     args = [
-        "boards", "work-item", "update",
+        *_TASK_UPDATE_HEAD,
         "--id", str(devops_id),
-        "--title", truncate_title(title),
+        "--title", truncate_title(_task_title(task)),
         "--state", state,
     ]
+    return args + _task_extra_args(task)
+
+
+# Throttled responses worth replaying. Azure DevOps answers 429 (and 503
+# when a request is blocked) before doing any work, so even a $batch
+# create is safe to resend. 502/504 are not retried: the gateway may time
+# out after the work item was written, and a replayed create duplicates it.
+_RETRY_STATUSES = (429, 503)
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 1.0  # seconds; doubles per retry, plus up to this much jitter
+_RETRY_MAX_DELAY = 30.0
+# Methods whose calls may be resent after a dropped keep-alive connection;
+# a POST (create, $batch) may already have been applied when the reset
+# arrives, so instead its connection is reopened up front once idle.
+_IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "PATCH", "DELETE")
+_IDLE_REOPEN = 15.0  # seconds a kept-alive connection may sit idle before a POST reopens it
+_CIRCUIT_THRESHOLD = 5  # consecutive 5xx/connection failures that open a host's circuit
+_CIRCUIT_COOLDOWN = 30.0  # seconds an open circuit rejects calls before a probe
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry number attempt (1-based).
+
+    Honors a numeric Retry-After header; otherwise exponential backoff
+    with jitter so parallel workers don't retry in lockstep.
+    """
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_MAX_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    backoff = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return backoff + random.uniform(0, _RETRY_BASE_DELAY)
+
+
+class _CircuitBreaker:
+    """Fail fast against a host that keeps failing.
+
+    Closed: calls pass. After _CIRCUIT_THRESHOLD consecutive 5xx or
+    connection failures it opens and rejects calls for _CIRCUIT_COOLDOWN
+    seconds, then lets a single half-open probe through: success closes
+    it again, failure reopens it.
+    """
 
-    # Description
-    desc_html = build_task_description(task)
-    if desc_html:
-        args += ["--description", desc_html]
+    def __init__(self, threshold: int = _CIRCUIT_THRESHOLD, cooldown: float = _CIRCUIT_COOLDOWN):
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None  # type: Optional[float]
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Whether a call may go out now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self._cooldown:
+                return False
+            self._probing = True
+            return True
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of a call that allow() let through."""
+        with self._lock:
+            if ok:
+                self._failures = 0
+                self._opened_at = None
+            else:
+                self._failures += 1
+                if self._probing or self._failures >= self._threshold:
+                    self._opened_at = time.monotonic()
+            self._probing = False
 
-    # Fields (priority, tags)
-    fields = []
-    priority = task.get("priority")
-    if priority is not None:
-        fields.append(f"Microsoft.VSTS.Common.Priority={priority}")
-    tags = task.get("tags", [])
-    if tags:
-        fields.append(f"System.Tags={';'.join(tags)}")
-    for field in fields:
-        args += ["--fields", field]
 
-    return args
+_BREAKERS = {}  # type: Dict[str, _CircuitBreaker]
+_BREAKERS_LOCK = threading.Lock()
+
+
+def _breaker_for(host: str) -> _CircuitBreaker:
+    """The circuit breaker shared by every call to host."""
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(host)
+        if breaker is None:
+            breaker = _BREAKERS[host] = _CircuitBreaker()
+        return breaker
+
+
+def _urlopen_with_retry(make_request: Callable[[], urllib.request.Request], timeout: int = 60) -> bytes:
+    """Send a urllib request, retrying throttled responses. Returns the body.
+
+    make_request builds a fresh Request per attempt (so a streamed body can
+    be rewound). Raises like urlopen, or URLError while the host's circuit
+    is open.
+    """
+    attempt = 0
+    while True:
+        req = make_request()
+        host = urllib.parse.urlsplit(req.full_url).netloc
+        breaker = _breaker_for(host)
+        if not breaker.allow():
+            raise urllib.error.URLError(f"circuit open for {host} after repeated failures")
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                body = resp.read()
+        except urllib.error.HTTPError as e:
+            breaker.record(e.code < 500)
+            attempt += 1
+            if e.code in _RETRY_STATUSES and attempt < _RETRY_ATTEMPTS:
+                time.sleep(_retry_delay(attempt, e.headers.get("Retry-After")))
+                continue
+            raise
+        except OSError:
+            breaker.record(False)
+            raise
+        breaker.record(True)
+        return body
+
+
+# json.dumps builds a new JSONEncoder whenever it gets non-default
+# arguments; build the compact one once and reuse it for every body.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def json_body(obj: Any) -> bytes:
+    """Serialize a REST request body as compact UTF-8 JSON.
+
+    No padding after separators and non-ASCII text kept as raw UTF-8
+    rather than 6-byte \\uXXXX escapes, which matters for $batch bodies
+    carrying up to 200 non-English work items.
+    """
+    return _JSON_ENCODER.encode(obj).encode("utf-8")
+
+
+def _auth_header(pat: str) -> str:
+    """Build the Authorization header: Bearer for az CLI tokens ('eyJ...'), Basic for PATs."""
+    if pat.startswith("eyJ"):
+        return f"Bearer {pat}"
+    token = base64.b64encode(f":{pat}".encode("utf-8")).decode("utf-8")
+    return f"Basic {token}"
 
 
 def upload_attachment(org_url: str, project: str, pat: str, file_path: str, filename: str) -> Optional[str]:
     """Upload a file attachment to Azure DevOps via REST API.
 
-    Uses urllib.request (stdlib) with PAT or Bearer token authentication.
+    Uses urllib.request (stdlib) with PAT or Bearer token authentication,
+    streaming the file body so memory stays flat regardless of file size.
     Bearer tokens (from az CLI) start with 'eyJ'; PATs use Basic auth.
     Returns the attachment URL on success, None on failure.
     """
@@ -282,31 +570,38 @@ def upload_attachment(org_url: str, project: str, pat: str, file_path: str, file
     encoded_filename = urllib.request.quote(filename, safe="")
     url = f"{org_url}/{encoded_project}/_apis/wit/attachments?fileName={encoded_filename}&api-version=7.0"
 
+    # Stream the file from disk instead of reading it into memory first;
+    # urllib sends a file-like body in blocks once Content-Length is set.
     try:
-        with open(file_path, "rb") as f:
-            body = f.read()
+        f = open(file_path, "rb")
     except OSError as e:
         progress(f"  WARNING: Could not read file for attachment: {e}")
         return None
 
-    req = urllib.request.Request(url, data=body, method="POST")
-    if pat.startswith("eyJ"):
-        req.add_header("Authorization", f"Bearer {pat}")
-    else:
-        token = base64.b64encode(f":{pat}".encode("utf-8")).decode("utf-8")
-        req.add_header("Authorization", f"Basic {token}")
-    req.add_header("Content-Type", "application/octet-stream")
+    with f:
+        try:
+            size = os.fstat(f.fileno()).st_size
+        except OSError as e:
+            progress(f"  WARNING: Could not read file for attachment: {e}")
+            return None
 
-    try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+        def make_request() -> urllib.request.Request:
+            f.seek(0)  # rewind for retries
+            req = urllib.request.Request(url, data=f, method="POST")
+            req.add_header("Authorization", _auth_header(pat))
+            req.add_header("Content-Type", "application/octet-stream")
+            req.add_header("Content-Length", str(size))
+            return req
+
+        try:
+            data = json.loads(_urlopen_with_retry(make_request).decode("utf-8"))
             return data.get("url")
-    except (urllib.error.HTTPError, urllib.error.URLError) as e:
-        progress(f"  WARNING: Attachment upload failed: {e}")
-        return None
-    except Exception as e:
-        progress(f"  WARNING: Attachment upload error: {e}")
-        return None
+        except (urllib.error.HTTPError, urllib.error.URLError) as e:
+            progress(f"  WARNING: Attachment upload failed: {e}")
+            return None
+        except Exception as e:
+            progress(f"  WARNING: Attachment upload error: {e}")
+            return None
 
 
 def attach_file_to_work_item(org_url: str, project: str, pat: str,
@@ -320,7 +615,7 @@ def attach_file_to_work_item(org_url: str, project: str, pat: str,
     org_url = org_url.rstrip("/")
     url = f"{org_url}/{urllib.request.quote(project, safe='')}/_apis/wit/workitems/{devops_id}?api-version=7.0"
 
-    body = json.dumps([{
+    body = json_body([{
         "op": "add",
         "path": "/relations/-",
         "value": {
@@ -328,41 +623,492 @@ def attach_file_to_work_item(org_url: str, project: str, pat: str,
             "url": attachment_url,
             "attributes": {"comment": "Story specification file"}
         }
-    }]).encode("utf-8")
+    }])
 
-    req = urllib.request.Request(url, data=body, method="PATCH")
-    if pat.startswith("eyJ"):
-        req.add_header("Authorization", f"Bearer {pat}")
-    else:
-        token = base64.b64encode(f":{pat}".encode("utf-8")).decode("utf-8")
-        req.add_header("Authorization", f"Basic {token}")
-    req.add_header("Content-Type", "application/json-patch+json")
+    def make_request() -> urllib.request.Request:
+        req = urllib.request.Request(url, data=body, method="PATCH")
+        req.add_header("Authorization", _auth_header(pat))
+        req.add_header("Content-Type", "application/json-patch+json")
+        return req
 
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return None
+        _urlopen_with_retry(make_request)
+        return None
     except (urllib.error.HTTPError, urllib.error.URLError) as e:
         return str(e)
     except Exception as e:
         return str(e)
 
 
-def get_az_access_token(az_path: str) -> str:
+def field_op(name: str, value: Any) -> Dict[str, Any]:
+    """Build a JSON-patch op that sets a work item field."""
+    return {"op": "add", "path": f"/fields/{name}", "value": value}
+
+
+def parent_link_op(parent_url: str) -> Dict[str, Any]:
+    """Build a JSON-patch op linking a work item to its parent (given the parent's API URL)."""
+    return {
+        "op": "add",
+        "path": "/relations/-",
+        "value": {"rel": "System.LinkTypes.Hierarchy-Reverse", "url": parent_url},
+    }
+
+
+def build_task_create_ops(task: Dict[str, Any], area: str, iteration: str, complete_state: str = "", parent_url: str = "") -> List[Dict[str, Any]]:
+    """Build the JSON-patch document for creating a task (REST twin of build_task_create_args).
+
+    With complete_state, a complete task is created directly in that state;
+    with parent_url, it is created already linked to its story.
+    """
+    ops = [field_op("System.Title", truncate_title(_task_title(task)))]
+    if area:
+        ops.append(field_op("System.AreaPath", area))
+    if iteration:
+        ops.append(field_op("System.IterationPath", iteration))
+
+    desc_html = build_task_description(task)
+    if desc_html:
+        ops.append(field_op("System.Description", desc_html))
+
+    priority = task.get("priority")
+    if priority is not None:
+        ops.append(field_op("Microsoft.VSTS.Common.Priority", priority))
+    tags = task.get("tags", [])
+    if tags:
+        ops.append(field_op("System.Tags", ";".join(tags)))
+
+    if complete_state and task.get("complete", False):
+        ops.append(field_op("System.State", complete_state))
+    if parent_url:
+        ops.append(parent_link_op(parent_url))
+
+    return ops
+
+
+def build_task_update_ops(task: Dict[str, Any], complete_state: str) -> List[Dict[str, Any]]:
+    """Build the JSON-patch document for updating a task (REST twin of build_task_update_args)."""
+    state = complete_state if task.get("complete", False) else "New"
+    ops = [
+        field_op("System.Title", truncate_title(_task_title(task))),
+        field_op("System.State", state),
+    ]
+
+    desc_html = build_task_description(task)
+    if desc_html:
+        ops.append(field_op("System.Description", desc_html))
+
+    priority = task.get("priority")
+    if priority is not None:
+        ops.append(field_op("Microsoft.VSTS.Common.Priority", priority))
+    tags = task.get("tags", [])
+    if tags:
+        ops.append(field_op("System.Tags", ";".join(tags)))
+
+    return ops
+
+
+def build_create_request(project: str, work_item_type: str, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap a work item create JSON-patch document as one $batch request entry."""
+    encoded_project = urllib.request.quote(project, safe="")
+    encoded_type = urllib.request.quote(work_item_type, safe="")
+    return {
+        "method": "PATCH",
+        "uri": f"/{encoded_project}/_apis/wit/workitems/${encoded_type}?api-version={_API_VERSION}",
+        "headers": {"Content-Type": "application/json-patch+json"},
+        "body": ops,
+    }
+
+
+def build_update_request(devops_id: int, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap a JSON-patch document for an existing work item as one $batch request entry."""
+    return {
+        "method": "PATCH",
+        "uri": f"/_apis/wit/workitems/{devops_id}?api-version={_API_VERSION}",
+        "headers": {"Content-Type": "application/json-patch+json"},
+        "body": ops,
+    }
+
+
+def parse_batch_response(data: Any, count: int) -> List[Tuple[Optional[int], Optional[str]]]:
+    """Map a $batch response to one (devops ID, error) pair per request, in request order.
+
+    Each response entry carries its own HTTP code; its body is a JSON string.
+    """
+    responses = data.get("value", []) if isinstance(data, dict) else []
+    outcomes = []
+    for i in range(count):
+        if i >= len(responses):
+            outcomes.append((None, "No response in batch"))
+            continue
+        entry = responses[i]
+        body = entry.get("body")
+        if isinstance(body, str):
+            try:
+                body = json.loads(body)
+            except json.JSONDecodeError:
+                body = {}
+        if not isinstance(body, dict):
+            body = {}
+        code = entry.get("code", 0)
+        if 200 <= code < 300:
+            devops_id = body.get("id")
+            outcomes.append((devops_id, None if devops_id else "No ID in response"))
+        else:
+            message = body.get("message", "")
+            outcomes.append((None, f"HTTP {code}: {message}" if message else f"HTTP {code}"))
+    return outcomes
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[urllib.parse.SplitResult]:
+    """The proxy urllib would use for scheme://host (HTTPS_PROXY / NO_PROXY etc.), or None."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    return urllib.parse.urlsplit(proxy)
+
+
+class RestClient:
+    """Azure DevOps REST client that keeps one HTTP connection alive per thread.
+
+    Talking to the REST API directly skips the az CLI process startup on
+    every call, and reusing the connection skips the TCP/TLS handshake.
+    token_provider(force) supplies refreshable az CLI tokens: it is asked
+    for the (cached) token before each call and forced once after a 401.
+    Throttled calls are retried with backoff, and calls fail fast while
+    the host's circuit breaker is open. Proxies are picked up from the
+    environment the same way urllib does: https goes through a CONNECT
+    tunnel, plain http sends absolute URLs to the proxy.
+    """
+
+    def __init__(self, org_url: str, pat: str, timeout: int = 120, token_provider: Optional[Callable[[bool], str]] = None):
+        self.org_url = org_url.rstrip("/")
+        parts = urllib.parse.urlsplit(self.org_url)
+        self._https = parts.scheme != "http"
+        self._host = parts.netloc
+        self._base_path = parts.path
+        self._pat = pat
+        self._timeout = timeout
+        self._token_provider = token_provider
+        self._token_lock = threading.Lock()
+        self._local = threading.local()
+        self._breaker = _breaker_for(self._host)
+        self._proxy = _proxy_for(parts.scheme or "https", parts.hostname or "")
+        self._proxy_headers = {}  # type: Dict[str, str]
+        if self._proxy and self._proxy.username:
+            credentials = f"{urllib.parse.unquote(self._proxy.username)}:{urllib.parse.unquote(self._proxy.password or '')}"
+            self._proxy_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        # A plain-http proxy is sent the absolute URL instead of just the path
+        self._url_prefix = f"http://{self._host}" if self._proxy and not self._https else ""
+
+    def _open(self) -> http.client.HTTPConnection:
+        if not self._proxy:
+            conn_cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            return conn_cls(self._host, timeout=self._timeout)
+        proxy_host, proxy_port = self._proxy.hostname, self._proxy.port or 80
+        if not self._https:
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=self._timeout)
+        conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self._timeout)
+        conn.set_tunnel(self._host, headers=self._proxy_headers)
+        return conn
+
+    def _connection(self, reopen_idle: bool = False) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and reopen_idle and conn.sock is not None \
+                and time.monotonic() - self._local.last_used > _IDLE_REOPEN:
+            self._reset()
+            conn = None
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+
+    def _reset(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def current_token(self) -> str:
+        """The token to send now, refreshed through token_provider when near expiry."""
+        if self._token_provider:
+            token = self._token_provider(False)
+            if token:
+                self._pat = token
+        return self._pat
+
+    def _refresh_token(self, rejected: str) -> bool:
+        """Force a new token after a 401 unless another thread already did. Returns True if it changed."""
+        with self._token_lock:
+            if self._pat == rejected:
+                token = self._token_provider(True)
+                if token:
+                    self._pat = token
+            return self._pat != rejected
+
+    def call(self, method: str, path: str, body: Any = None, content_type: str = "application/json") -> Tuple[Optional[Any], Optional[str]]:
+        """Send one request to a path under the org URL.
+
+        Returns (parsed JSON, None) on success, mirroring run_az, or
+        (None, error message) on failure.
+        """
+        headers = {"Accept": "application/json"}
+        if not self._https:
+            headers.update(self._proxy_headers)
+        idempotent = method in _IDEMPOTENT_METHODS
+        data = None
+        if body is not None:
+            data = json_body(body)
+            headers["Content-Type"] = content_type
+
+        reconnected = False
+        refreshed = False
+        replay = False
+        attempt = 0
+        while True:
+            # A replay on a fresh connection is still the same admitted call
+            if not replay and not self._breaker.allow():
+                return None, f"Circuit open for {self._host} after repeated failures"
+            replay = False
+            token = self.current_token()
+            headers["Authorization"] = _auth_header(token)
+            conn = self._connection(reopen_idle=not idempotent)
+            reused = conn.sock is not None
+            try:
+                conn.request(method, self._url_prefix + self._base_path + path, body=data, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (http.client.HTTPException, OSError) as e:
+                self._reset()
+                # The server may have closed an idle keep-alive connection; retry once on
+                # a fresh one, but only when resending cannot apply the call twice
+                if not reconnected and reused and idempotent and isinstance(e, (ConnectionResetError, BrokenPipeError)):
+                    reconnected = True
+                    replay = True
+                    continue
+                self._breaker.record(False)
+                return None, str(e)
+            self._local.last_used = time.monotonic()
+            self._breaker.record(resp.status < 500)
+            # An expired az token: refresh once and replay the request
+            if resp.status == 401 and self._token_provider and not refreshed:
+                refreshed = True
+                if self._refresh_token(token):
+                    continue
+            if resp.status in _RETRY_STATUSES and attempt + 1 < _RETRY_ATTEMPTS:
+                attempt += 1
+                time.sleep(_retry_delay(attempt, resp.getheader("Retry-After")))
+                continue
+            break
+
+        if resp.status >= 400:
+            message = ""
+            try:
+                message = json.loads(raw.decode("utf-8")).get("message", "")
+            except (ValueError, AttributeError):
+                pass
+            return None, f"HTTP {resp.status}: {message or resp.reason}"
+        if not raw.strip():
+            return {}, None
+        try:
+            return json.loads(raw.decode("utf-8")), None
+        except ValueError:
+            return None, f"Invalid JSON response: {raw[:200]!r}"
+
+    def work_item_url(self, devops_id: int) -> str:
+        """API URL of a work item, as used in relation links."""
+        return f"{self.org_url}/_apis/wit/workItems/{devops_id}"
+
+    def update_work_item(self, project: str, devops_id: int, ops: List[Dict[str, Any]]) -> Tuple[Optional[Any], Optional[str]]:
+        """Apply a JSON-patch document to an existing work item."""
+        path = f"/{urllib.parse.quote(project, safe='')}/_apis/wit/workitems/{devops_id}?api-version={_API_VERSION}"
+        return self.call("PATCH", path, ops, content_type="application/json-patch+json")
+
+    def create_iteration(self, project: str, parent_path: str, name: str) -> Tuple[Optional[Any], Optional[str]]:
+        """Create an iteration node under parent_path (relative to the project's iteration root)."""
+        path = f"/{urllib.parse.quote(project, safe='')}/_apis/wit/classificationnodes/Iterations"
+        for segment in parent_path.split("\\"):
+            if segment:
+                path += "/" + urllib.parse.quote(segment, safe="")
+        return self.call("POST", f"{path}?api-version={_API_VERSION}", {"name": name})
+
+
+def _send_batch(client: RestClient, requests: List[Dict[str, Any]], action: str, fallback: Optional[Callable[[Dict[str, Any]], Tuple[Optional[int], Optional[str]]]] = None, max_workers: int = 1) -> List[Tuple[Optional[int], Optional[str]]]:
+    """POST requests to the $batch endpoint in chunks of 200. Returns one (devops ID, error) pair per request.
+
+    Up to max_workers chunks are in flight at once, each on its worker's
+    own connection. When a whole call fails, fallback (if given) sends each
+    request of that chunk on its own; otherwise they are all marked failed.
+    """
+    def _send_chunk(chunk):
+        data, err = client.call("POST", f"/_apis/wit/$batch?api-version={_API_VERSION}", chunk)
+        if not err:
+            return parse_batch_response(data, len(chunk))
+        if fallback:
+            return [fallback(request) for request in chunk]
+        return [(None, f"Batch {action} failed: {err}")] * len(chunk)
+
+    chunks = [requests[start:start + _BATCH_SIZE] for start in range(0, len(requests), _BATCH_SIZE)]
+    return [outcome for outcomes in _map_items(_send_chunk, chunks, max_workers) for outcome in outcomes]
+
+
+def batch_create_workitems(client: RestClient, requests: List[Dict[str, Any]], max_workers: int = 1) -> List[Tuple[Optional[int], Optional[str]]]:
+    """Create work items through the REST $batch endpoint, up to 200 per call.
+
+    requests are entries from build_create_request. Returns one
+    (devops ID, error) pair per request, in request order. A failed call
+    marks every request in its chunk as failed; $batch is not transactional,
+    so other chunks are unaffected. Up to max_workers calls run at once.
+    """
+    return _send_batch(client, requests, "create", max_workers=max_workers)
+
+
+def _rounds(devops_ids: List[int]) -> List[List[int]]:
+    """Group indices so round r holds the r-th occurrence of every work item.
+
+    Running the rounds one after another keeps each item's operations in
+    list order while everything within a round can run at once.
+    """
+    rounds = []  # type: List[List[int]]
+    seen = {}  # type: Dict[int, int]
+    for index, devops_id in enumerate(devops_ids):
+        r = seen.get(devops_id, 0)
+        seen[devops_id] = r + 1
+        if r == len(rounds):
+            rounds.append([])
+        rounds[r].append(index)
+    return rounds
+
+
+def batch_update_workitems(client: RestClient, updates: List[Tuple[int, List[Dict[str, Any]]]], max_workers: int = 1) -> List[Optional[str]]:
+    """Apply JSON-patch documents to existing work items through $batch, up to 200 per call.
+
+    updates are (devops ID, ops) pairs. A work item listed more than once
+    is patched in list order: its later patches go out in later calls. If
+    a whole call fails, its patches are retried one PATCH at a time. Up to
+    max_workers calls of a round run at once. Returns one error (None on success) per update, in order.
+    """
+    def _patch_one(request):
+        data, err = client.call("PATCH", request["uri"], request["body"], content_type="application/json-patch+json")
+        return (data or {}).get("id"), err
+
+    errors = [None] * len(updates)  # type: List[Optional[str]]
+    for indices in _rounds([devops_id for devops_id, _ in updates]):
+        requests = [build_update_request(*updates[index]) for index in indices]
+        for index, (_, err) in zip(indices, _send_batch(client, requests, "update", fallback=_patch_one, max_workers=max_workers)):
+            errors[index] = err
+    return errors
+
+
+def batch_add_parent_links(client: RestClient, links: List[Tuple[int, int]], max_workers: int = 1) -> List[Optional[str]]:
+    """Link existing work items to their parents through $batch, up to 200 per call.
+
+    links are (child devops ID, parent devops ID) pairs. Up to max_workers
+    calls run at once. Returns one error (None on success) per pair, in order.
+    """
+    requests = [build_update_request(child, [parent_link_op(client.work_item_url(parent))]) for child, parent in links]
+    return [err for _, err in _send_batch(client, requests, "link", max_workers=max_workers)]
+
+
+def _link_created_via_batch(client: RestClient, created: List[Dict[str, Any]], parent_key: str, max_workers: int = 1) -> None:
+    """Add the parent links of items created via az in one pass of $batch calls."""
+    links = [(entry["devopsId"], entry[parent_key]) for entry in created if entry.get(parent_key)]
+    if not links:
+        return
+    progress(f"Adding {len(links)} parent link(s) via $batch")
+    for (child, _), err in zip(links, batch_add_parent_links(client, links, max_workers)):
+        if err:
+            progress(f"  WARNING: Parent link for #{child} failed: {err}")
+
+
+def _create_via_batch(client: RestClient, project: str, items: List[Dict[str, Any]], work_item_type: str, build_ops: Callable[[Dict[str, Any]], List[Dict[str, Any]]], max_workers: int = 1) -> Dict[str, Tuple[Optional[int], Optional[str]]]:
+    """Create every NEW item in one pass of $batch calls. Returns item ID -> (devops ID, error)."""
+    new_items = [item for item in items if item.get("classification") == "NEW"]
+    if not new_items:
+        return {}
+    progress(f"Creating {len(new_items)} {work_item_type} item(s) via $batch")
+    requests = [build_create_request(project, work_item_type, build_ops(item)) for item in new_items]
+    outcomes = batch_create_workitems(client, requests, max_workers)
+    return {item.get("id", ""): outcome for item, outcome in zip(new_items, outcomes)}
+
+
+def _update_via_batch(client: RestClient, items: List[Dict[str, Any]], work_item_type: str, build_ops: Callable[[Dict[str, Any]], List[Dict[str, Any]]], max_workers: int = 1) -> Dict[str, Optional[str]]:
+    """Apply every CHANGED item's update in one pass of $batch calls. Returns item ID -> error."""
+    changed = [item for item in items if item.get("classification") == "CHANGED" and item.get("devopsId")]
+    if not changed:
+        return {}
+    progress(f"Updating {len(changed)} {work_item_type} item(s) via $batch")
+    errors = batch_update_workitems(client, [(item["devopsId"], build_ops(item)) for item in changed], max_workers)
+    return {item.get("id", ""): err for item, err in zip(changed, errors)}
+
+
+def _add_parent_link(az_path: str, devops_id: int, parent_devops_id: int) -> Tuple[Optional[Any], Optional[str]]:
+    """Link a work item to its parent via az (REST creates carry the link in the create call)."""
+    return run_az(az_path, [
+        "boards", "work-item", "relation", "add",
+        "--id", str(devops_id),
+        "--relation-type", "parent",
+        "--target-id", str(parent_devops_id),
+    ])
+
+
+_TOKEN_CACHE = {"token": "", "expires": 0.0}
+_TOKEN_LOCK = threading.Lock()
+_TOKEN_REFRESH_MARGIN = 60  # seconds before expiry at which a cached token is refetched
+_TOKEN_DEFAULT_TTL = 300  # cache lifetime when az reports no usable expiry
+
+
+def _token_expiry(data: Dict[str, Any]) -> float:
+    """Read a token's expiry (epoch seconds) from az account get-access-token output.
+
+    Newer az versions report epoch 'expires_on'; older ones only a local-time
+    'expiresOn' string. Unknown expiry yields a short default lifetime.
+    """
+    try:
+        return float(data["expires_on"])
+    except (KeyError, TypeError, ValueError):
+        pass
+    try:
+        return time.mktime(time.strptime(data["expiresOn"].split(".")[0], "%Y-%m-%d %H:%M:%S"))
+    except (KeyError, AttributeError, ValueError, OverflowError):
+        return time.time() + _TOKEN_DEFAULT_TTL
+
+
+def get_az_access_token(az_path: str, force: bool = False) -> str:
     """Fetch an Azure DevOps access token via az CLI.
 
+    The token is cached until shortly before it expires, so concurrent
+    workers share one az call; force=True refetches (e.g. after a 401).
     Falls back to empty string on any failure so callers can skip attachment.
     Uses the Azure DevOps resource ID (499b84ac-1321-427f-aa17-267ca6975798).
     """
-    args = ["account", "get-access-token", "--resource", "499b84ac-1321-427f-aa17-267ca6975798"]
-    data, err = run_az(az_path, args)
-    if err or not data:
-        return ""
-    return data.get("accessToken", "")
+    with _TOKEN_LOCK:
+        if not force and _TOKEN_CACHE["token"] and time.time() < _TOKEN_CACHE["expires"] - _TOKEN_REFRESH_MARGIN:
+            return _TOKEN_CACHE["token"]
+        args = ["account", "get-access-token", "--resource", "499b84ac-1321-427f-aa17-267ca6975798"]
+        data, err = run_az(az_path, args)
+        if err or not data:
+            return ""
+        token = data.get("accessToken", "")
+        if token:
+            _TOKEN_CACHE["token"] = token
+            _TOKEN_CACHE["expires"] = _token_expiry(data)
+        return token
+
+
+_PROGRESS_LOCK = threading.Lock()
 
 
 def progress(msg: str) -> None:
     """Print progress message to stderr so stdout stays clean for JSON."""
-    print(msg, file=sys.stderr, flush=True)
+    # Serialized so lines from concurrent sync workers never interleave.
+    # One write per line: print() would write the text and the newline
+    # separately. Still flushed per line, since the workflow watches
+    # stderr for live progress.
+    with _PROGRESS_LOCK:
+        sys.stderr.write(msg + "\n")
+        sys.stderr.flush()
 
 
 def get_default_iteration(config: Dict[str, str]) -> str:
@@ -383,127 +1129,278 @@ def get_default_iteration(config: Dict[str, str]) -> str:
     return iteration_root
 
 
-def sync_epics(az_path: str, config: Dict[str, str], epics: List[Dict[str, Any]], epic_statuses: Optional[Dict[str, str]] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
-    """Create/update epics with state sync. Returns dict mapping epic ID -> devops ID."""
+class SyncContext(NamedTuple):
+    """Per-run settings shared by every sync layer.
+
+    Built once by build_sync_context, so config lookups and template
+    mappings are resolved once per run rather than once per layer. Status
+    to state mapping is not stored here: each layer pre-maps its own
+    statuses into a state_for dict.
+    """
+    az_path: str
+    template: str
+    project: str
+    area: str
+    iteration: str
+    iteration_root_path: str
+    story_type: str
+    ac_field: Optional[str]
+    complete_state: str
+    org_url: str = ""
+    pat: str = ""
+    client: Optional[RestClient] = None
+    max_workers: int = 1
+
+
+def build_sync_context(az_path: str, config: Dict[str, str], org_url: str = "", pat: str = "", client: Optional[RestClient] = None, max_workers: int = 1) -> SyncContext:
+    """Resolve config values and template mappings into a SyncContext."""
+    template = config.get("processTemplate", "Agile")
+    return SyncContext(
+        az_path=az_path,
+        template=template,
+        project=config.get("projectName", ""),
+        area=config.get("areaPath", ""),
+        iteration=get_default_iteration(config),
+        iteration_root_path=config.get("iterationRootPath", ""),
+        story_type=get_story_type(template),
+        ac_field=get_ac_field(template),
+        complete_state=get_complete_state(template),
+        org_url=org_url,
+        pat=pat,
+        client=client,
+        max_workers=max_workers,
+    )
+
+
+_DEFAULT_MAX_WORKERS = 8
+_SYNC_CLASSES = ("NEW", "CHANGED")
+_SKIP_CLASSES = ("UNCHANGED", "ORPHANED")
+
+
+def _map_items(fn: Callable[[Any], Any], items: List[Any], max_workers: int) -> List[Any]:
+    """Apply fn to every item, concurrently when max_workers > 1.
+
+    Results are returned in input order so the sync output stays identical
+    to a serial run regardless of which az call finishes first.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
+def sync_epics(ctx: SyncContext, epics: List[Dict[str, Any]], epic_statuses: Optional[Dict[str, str]] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """Create/update epics with state sync. Returns dict mapping epic ID -> devops ID.
+
+    With ctx.client set, NEW epics are created and CHANGED ones updated up
+    front via $batch; without one, each call runs through az.
+    """
     results = {"created": [], "updated": [], "failed": [], "skipped": []}
     id_map = {}
 
-    area = config.get("areaPath", "")
-    iteration = get_default_iteration(config)
-    template = config.get("processTemplate", "Agile")
-    epic_statuses = epic_statuses or {}
+    az_path, client, project, template = ctx.az_path, ctx.client, ctx.project, ctx.template
+    area, iteration = ctx.area, ctx.iteration
+    # Map each epic's status once; the create and update paths both look it up
+    state_for = {
+        eid: map_bmad_status_to_devops_state(status, template)
+        for eid, status in (epic_statuses or {}).items()
+    }
 
-    for epic in epics:
+    def _content(epic):
+        """(title, HTML description) as sent on both create and update."""
+        return truncate_title(epic.get("title", "")), wrap_html(epic.get("description", ""))
+
+    def _create_ops(epic):
+        title, description = _content(epic)
+        ops = [field_op("System.Title", title), field_op("System.Description", description)]
+        if area:
+            ops.append(field_op("System.AreaPath", area))
+        if iteration:
+            ops.append(field_op("System.IterationPath", iteration))
+        # Create directly in the mapped state instead of a follow-up update
+        devops_state = state_for.get(epic.get("id", ""))
+        if devops_state and devops_state != "New":
+            ops.append(field_op("System.State", devops_state))
+        return ops
+
+    def _update_ops(epic):
+        title, description = _content(epic)
+        ops = [field_op("System.Title", title), field_op("System.Description", description)]
+        # Include state in update if epic has a BMAD status
+        devops_state = state_for.get(epic.get("id", ""))
+        if devops_state:
+            ops.append(field_op("System.State", devops_state))
+        return ops
+
+    batch_created, batch_updated = {}, {}
+    if client:
+        batch_created = _create_via_batch(client, project, epics, "Epic", _create_ops, ctx.max_workers)
+        batch_updated = _update_via_batch(client, epics, "Epic", _update_ops, ctx.max_workers)
+
+    def _sync_epic(epic):
+        """Sync one epic. Returns (result bucket, result entry, mapped devops ID)."""
         cls = epic.get("classification", "")
         epic_id = epic.get("id", "")
 
-        if cls == "UNCHANGED" or cls == "ORPHANED":
-            if epic.get("devopsId"):
-                id_map[epic_id] = epic["devopsId"]
-            results["skipped"].append({"id": epic_id, "classification": cls})
-            continue
-
         if cls == "NEW":
-            args = [
-                "boards", "work-item", "create",
-                "--type", "Epic",
-                "--title", truncate_title(epic.get("title", "")),
-                "--description", wrap_html(epic.get("description", ""), max_len=3000),
-            ]
-            if area:
-                args += ["--area", area]
-            if iteration:
-                args += ["--iteration", iteration]
-
             progress(f"Creating Epic {epic_id}: {epic.get('title', '')}")
-            data, err = run_az(az_path, args)
+            # Batch creates already carry the state
+            if epic_id in batch_created:
+                devops_id, err = batch_created[epic_id]
+            else:
+                title, description = _content(epic)
+                args = [
+                    "boards", "work-item", "create",
+                    "--type", "Epic",
+                    "--title", title,
+                    "--description", description,
+                ]
+                if area:
+                    args += ["--area", area]
+                if iteration:
+                    args += ["--iteration", iteration]
+
+                # Create directly in the mapped state instead of a follow-up update
+                devops_state = state_for.get(epic_id)
+                if devops_state and devops_state != "New":
+                    args += _fields_args([f"System.State={devops_state}"])
+
+                data, err = run_az(az_path, args)
+                devops_id = None if err else data.get("id")
 
             if err:
                 progress(f"  FAILED: {err}")
-                results["failed"].append({"id": epic_id, "error": err})
-                continue
+                return "failed", {"id": epic_id, "error": err}, None
 
-            devops_id = data.get("id")
-            if devops_id:
-                id_map[epic_id] = devops_id
+            if not devops_id:
+                return "failed", {"id": epic_id, "error": "No ID in response"}, None
 
-                # Update state if epic has a non-default BMAD status
-                devops_state = map_bmad_status_to_devops_state(
-                    epic_statuses.get(epic_id), template
-                )
-                if devops_state and devops_state != "New":
-                    state_args = [
-                        "boards", "work-item", "update",
-                        "--id", str(devops_id),
-                        "--state", devops_state,
-                    ]
-                    _, state_err = run_az(az_path, state_args)
-                    if state_err:
-                        progress(f"  WARNING: State update to '{devops_state}' failed: {state_err}")
-                    else:
-                        progress(f"  Set state to '{devops_state}'")
-
-                results["created"].append({
-                    "id": epic_id, "devopsId": devops_id,
-                    "contentHash": epic.get("contentHash", "")
-                })
-                progress(f"  Created Epic #{devops_id}")
-            else:
-                results["failed"].append({"id": epic_id, "error": "No ID in response"})
+            progress(f"  Created Epic #{devops_id}")
+            return "created", {
+                "id": epic_id, "devopsId": devops_id,
+                "contentHash": epic.get("contentHash", "")
+            }, devops_id
 
-        elif cls == "CHANGED":
+        if cls == "CHANGED":
             devops_id = epic.get("devopsId")
             if not devops_id:
-                results["failed"].append({"id": epic_id, "error": "No existing DevOps ID for update"})
-                continue
-
-            id_map[epic_id] = devops_id
-            args = [
-                "boards", "work-item", "update",
-                "--id", str(devops_id),
-                "--title", truncate_title(epic.get("title", "")),
-                "--description", wrap_html(epic.get("description", ""), max_len=3000),
-            ]
-
-            # Include state in update if epic has a BMAD status
-            devops_state = map_bmad_status_to_devops_state(
-                epic_statuses.get(epic_id), template
-            )
-            if devops_state:
-                args += ["--state", devops_state]
+                return "failed", {"id": epic_id, "error": "No existing DevOps ID for update"}, None
 
             progress(f"Updating Epic {epic_id} (#{devops_id}): {epic.get('title', '')}")
-            data, err = run_az(az_path, args)
+            if client:
+                err = batch_updated[epic_id]
+            else:
+                title, description = _content(epic)
+
+                # Include state in update if epic has a BMAD status
+                devops_state = state_for.get(epic_id)
+                args = [
+                    "boards", "work-item", "update",
+                    "--id", str(devops_id),
+                    "--title", title,
+                    "--description", description,
+                ]
+                if devops_state:
+                    args += ["--state", devops_state]
+                data, err = run_az(az_path, args)
 
             if err:
                 progress(f"  FAILED: {err}")
-                results["failed"].append({"id": epic_id, "devopsId": devops_id, "error": err})
-            else:
-                results["updated"].append({
-                    "id": epic_id, "devopsId": devops_id,
-                    "contentHash": epic.get("contentHash", "")
-                })
-                progress(f"  Updated Epic #{devops_id}")
+                return "failed", {"id": epic_id, "devopsId": devops_id, "error": err}, devops_id
+            progress(f"  Updated Epic #{devops_id}")
+            return "updated", {
+                "id": epic_id, "devopsId": devops_id,
+                "contentHash": epic.get("contentHash", "")
+            }, devops_id
+
+        return None, None, None
+
+    # Only NEW/CHANGED epics reach the workers. Skips are recorded inline in
+    # the same pass, which keeps the results and ID map in input order
+    pending = [epic for epic in epics if epic.get("classification") in _SYNC_CLASSES]
+    outcomes = iter(_map_items(_sync_epic, pending, ctx.max_workers))
+    for epic in epics:
+        cls = epic.get("classification", "")
+        if cls in _SYNC_CLASSES:
+            bucket, entry, devops_id = next(outcomes)
+        elif cls in _SKIP_CLASSES:
+            bucket, entry, devops_id = "skipped", {"id": epic.get("id", ""), "classification": cls}, epic.get("devopsId")
+        else:
+            continue
+        if devops_id:
+            id_map[epic.get("id", "")] = devops_id
+        if bucket:
+            results[bucket].append(entry)
 
     return results, id_map
 
 
-def sync_stories(az_path: str, config: Dict[str, str], stories: List[Dict[str, Any]], epic_id_map: Dict[str, int], story_statuses: Optional[Dict[str, str]] = None, story_file_paths: Optional[Dict[str, str]] = None, org_url: str = "", pat: str = "") -> Tuple[Dict[str, Any], Dict[str, int]]:
-    """Create/update stories with parent links to epics, state sync, and file attachments."""
+def sync_stories(ctx: SyncContext, stories: List[Dict[str, Any]], epic_id_map: Dict[str, int], story_statuses: Optional[Dict[str, str]] = None, story_file_paths: Optional[Dict[str, str]] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """Create/update stories with parent links to epics, state sync, and file attachments.
+
+    With ctx.client set, NEW stories are created and CHANGED ones updated up
+    front via $batch, and attachments go over REST; without one, each call
+    runs through az.
+    """
     results = {"created": [], "updated": [], "failed": [], "skipped": []}
     id_map = {}
 
-    area = config.get("areaPath", "")
-    iteration = get_default_iteration(config)
-    template = config.get("processTemplate", "Agile")
-    story_type = get_story_type(template)
-    ac_field = get_ac_field(template)
-    story_statuses = story_statuses or {}
+    az_path, client, project, template = ctx.az_path, ctx.client, ctx.project, ctx.template
+    area, iteration, story_type, ac_field = ctx.area, ctx.iteration, ctx.story_type, ctx.ac_field
+    org_url, pat = ctx.org_url, ctx.pat
+    # Map each story's status once; the create and update paths both look it up
+    state_for = {
+        sid: map_bmad_status_to_devops_state(status, template)
+        for sid, status in (story_statuses or {}).items()
+    }
     story_file_paths = story_file_paths or {}
-    project = config.get("projectName", "")
 
     attached_ids = set()
 
+    def _content(story):
+        """(title, HTML description, HTML acceptance criteria or "") as sent on both create and update."""
+        ac_text = story.get("acceptanceCriteria", "")
+        ac_html = wrap_html(ac_text) if ac_text and ac_field else ""
+        return truncate_title(story.get("title", "")), wrap_html(story.get("userStoryText", "")), ac_html
+
+    def _create_ops(story):
+        title, description, ac_html = _content(story)
+        ops = [field_op("System.Title", title), field_op("System.Description", description)]
+        if area:
+            ops.append(field_op("System.AreaPath", area))
+        if iteration:
+            ops.append(field_op("System.IterationPath", iteration))
+        if ac_html:
+            ops.append(field_op(ac_field, ac_html))
+        # Create directly in the mapped state and under the parent epic
+        # instead of two follow-up updates
+        devops_state = state_for.get(story.get("id", ""))
+        if devops_state and devops_state != "New":
+            ops.append(field_op("System.State", devops_state))
+        epic_devops_id = epic_id_map.get(story.get("epicId", ""))
+        if epic_devops_id:
+            ops.append(parent_link_op(client.work_item_url(epic_devops_id)))
+        return ops
+
+    def _update_ops(story):
+        title, description, ac_html = _content(story)
+        ops = [field_op("System.Title", title), field_op("System.Description", description)]
+        if ac_html:
+            ops.append(field_op(ac_field, ac_html))
+        # Include state in update if story has a BMAD status
+        devops_state = state_for.get(story.get("id", ""))
+        if devops_state:
+            ops.append(field_op("System.State", devops_state))
+        return ops
+
+    batch_created, batch_updated = {}, {}
+    if client:
+        batch_created = _create_via_batch(client, project, stories, story_type, _create_ops, ctx.max_workers)
+        batch_updated = _update_via_batch(client, stories, story_type, _update_ops, ctx.max_workers)
+    # az creates can't carry the parent link; with REST credentials (for
+    # attachments) the links go out together in $batch after the loop
+    link_client = RestClient(org_url, pat) if not client and org_url and pat else None
+
     def _attach_story_file(story_id, devops_id):
         """Attach story .md file to a work item if org/PAT/path available.
 
@@ -513,10 +1410,12 @@ def sync_stories(az_path: str, config: Dict[str, str], stories: List[Dict[str, A
         if not file_path or not org_url or not pat:
             return False
         filename = os.path.basename(file_path)
+        # Prefer the client's token: it is refreshed when an az token nears expiry
+        token = client.current_token() if client else pat
         progress(f"  Uploading attachment: {filename}")
-        att_url = upload_attachment(org_url, project, pat, file_path, filename)
+        att_url = upload_attachment(org_url, project, token, file_path, filename)
         if att_url:
-            att_err = attach_file_to_work_item(org_url, project, pat, devops_id, att_url)
+            att_err = attach_file_to_work_item(org_url, project, token, devops_id, att_url)
             if att_err:
                 progress(f"  WARNING: Attach relation failed: {att_err}")
                 return False
@@ -525,257 +1424,321 @@ def sync_stories(az_path: str, config: Dict[str, str], stories: List[Dict[str, A
                 return True
         return False
 
-    for story in stories:
+    # Uploads run on their own pool so a story worker can move on to the
+    # next create/update instead of waiting for the file transfer
+    attach_pool = None
+    if ctx.max_workers > 1 and org_url and pat and story_file_paths:
+        attach_pool = ThreadPoolExecutor(max_workers=ctx.max_workers)
+
+    def _queue_attachment(story_id, devops_id):
+        """Attach now when serial, else schedule it. Returns a bool or a Future of one."""
+        if attach_pool is None or not story_file_paths.get(story_id):
+            return _attach_story_file(story_id, devops_id)
+        return attach_pool.submit(_attach_story_file, story_id, devops_id)
+
+    def _sync_story(story):
+        """Sync one story. Returns (result bucket, result entry, mapped devops ID, attached)."""
         cls = story.get("classification", "")
         story_id = story.get("id", "")
 
-        if cls == "UNCHANGED" or cls == "ORPHANED":
-            if story.get("devopsId"):
-                id_map[story_id] = story["devopsId"]
-            # Backfill attachment for previously-synced stories that lack one
-            if cls == "UNCHANGED" and story.get("attached") != "true":
-                devops_id = story.get("devopsId")
-                if devops_id and _attach_story_file(story_id, devops_id):
-                    attached_ids.add(story_id)
-            elif cls == "UNCHANGED" and story.get("attached") == "true":
-                attached_ids.add(story_id)
-            results["skipped"].append({"id": story_id, "classification": cls})
-            continue
+        if cls == "UNCHANGED":
+            # Backfill attachment for a previously-synced story that lacks one
+            devops_id = story.get("devopsId")
+            return "skipped", {"id": story_id, "classification": cls}, devops_id, _queue_attachment(story_id, devops_id)
 
         if cls == "NEW":
-            args = [
-                "boards", "work-item", "create",
-                "--type", story_type,
-                "--title", truncate_title(story.get("title", "")),
-                "--description", wrap_html(story.get("userStoryText", ""), max_len=3000),
-            ]
-            if area:
-                args += ["--area", area]
-            if iteration:
-                args += ["--iteration", iteration]
-
-            # Add acceptance criteria
-            ac_text = story.get("acceptanceCriteria", "")
-            if ac_text and ac_field:
-                args += ["--fields", f"{ac_field}={wrap_html(ac_text, max_len=3000)}"]
-
             progress(f"Creating Story {story_id}: {story.get('title', '')}")
-            data, err = run_az(az_path, args)
+            # Batch creates already carry the parent link and state
+            fused = story_id in batch_created
+            if fused:
+                devops_id, err = batch_created[story_id]
+            else:
+                title, description, ac_html = _content(story)
+                args = [
+                    "boards", "work-item", "create",
+                    "--type", story_type,
+                    "--title", title,
+                    "--description", description,
+                ]
+                if area:
+                    args += ["--area", area]
+                if iteration:
+                    args += ["--iteration", iteration]
+
+                # Add acceptance criteria, and create directly in the
+                # mapped state instead of a follow-up update
+                fields = []
+                if ac_html:
+                    fields.append(f"{ac_field}={ac_html}")
+                devops_state = state_for.get(story_id)
+                if devops_state and devops_state != "New":
+                    fields.append(f"System.State={devops_state}")
+                args += _fields_args(fields)
+
+                data, err = run_az(az_path, args)
+                devops_id = None if err else data.get("id")
 
             if err:
                 progress(f"  FAILED: {err}")
-                results["failed"].append({"id": story_id, "error": err})
-                continue
+                return "failed", {"id": story_id, "error": err}, None, False
 
-            devops_id = data.get("id")
             if not devops_id:
-                results["failed"].append({"id": story_id, "error": "No ID in response"})
-                continue
+                return "failed", {"id": story_id, "error": "No ID in response"}, None, False
 
-            id_map[story_id] = devops_id
             progress(f"  Created Story #{devops_id}")
 
             # Add parent link to epic
             epic_id = story.get("epicId", "")
             epic_devops_id = epic_id_map.get(epic_id)
-            if epic_devops_id:
-                link_args = [
-                    "boards", "work-item", "relation", "add",
-                    "--id", str(devops_id),
-                    "--relation-type", "parent",
-                    "--target-id", str(epic_devops_id),
-                ]
-                _, link_err = run_az(az_path, link_args)
+            if epic_devops_id and not fused and not link_client:
+                _, link_err = _add_parent_link(az_path, devops_id, epic_devops_id)
                 if link_err:
                     progress(f"  WARNING: Parent link failed: {link_err}")
 
-            # Update state if story has a non-default BMAD status
-            devops_state = map_bmad_status_to_devops_state(
-                story_statuses.get(story_id), template
-            )
-            if devops_state and devops_state != "New":
-                state_args = [
-                    "boards", "work-item", "update",
-                    "--id", str(devops_id),
-                    "--state", devops_state,
-                ]
-                _, state_err = run_az(az_path, state_args)
-                if state_err:
-                    progress(f"  WARNING: State update to '{devops_state}' failed: {state_err}")
-                else:
-                    progress(f"  Set state to '{devops_state}'")
-
             # Attach story .md file
-            if _attach_story_file(story_id, devops_id):
-                attached_ids.add(story_id)
+            attached = _queue_attachment(story_id, devops_id)
 
-            results["created"].append({
+            return "created", {
                 "id": story_id, "devopsId": devops_id,
                 "epicDevopsId": epic_devops_id,
                 "contentHash": story.get("contentHash", "")
-            })
+            }, devops_id, attached
 
-        elif cls == "CHANGED":
+        if cls == "CHANGED":
             devops_id = story.get("devopsId")
             if not devops_id:
-                results["failed"].append({"id": story_id, "error": "No existing DevOps ID for update"})
-                continue
-
-            id_map[story_id] = devops_id
-            args = [
-                "boards", "work-item", "update",
-                "--id", str(devops_id),
-                "--title", truncate_title(story.get("title", "")),
-                "--description", wrap_html(story.get("userStoryText", ""), max_len=3000),
-            ]
-
-            ac_text = story.get("acceptanceCriteria", "")
-            if ac_text and ac_field:
-                args += ["--fields", f"{ac_field}={wrap_html(ac_text, max_len=3000)}"]
-
-            # Include state in update if story has a BMAD status
-            devops_state = map_bmad_status_to_devops_state(
-                story_statuses.get(story_id), template
-            )
-            if devops_state:
-                args += ["--state", devops_state]
+                return "failed", {"id": story_id, "error": "No existing DevOps ID for update"}, None, False
 
             progress(f"Updating Story {story_id} (#{devops_id})")
-            data, err = run_az(az_path, args)
+            if client:
+                err = batch_updated[story_id]
+            else:
+                title, description, ac_html = _content(story)
+
+                # Include state in update if story has a BMAD status
+                devops_state = state_for.get(story_id)
+                args = [
+                    "boards", "work-item", "update",
+                    "--id", str(devops_id),
+                    "--title", title,
+                    "--description", description,
+                ]
+                if ac_html:
+                    args += ["--fields", f"{ac_field}={ac_html}"]
+                if devops_state:
+                    args += ["--state", devops_state]
+                data, err = run_az(az_path, args)
 
             if err:
                 progress(f"  FAILED: {err}")
-                results["failed"].append({"id": story_id, "devopsId": devops_id, "error": err})
-            else:
-                # Attach updated story .md file
-                if _attach_story_file(story_id, devops_id):
-                    attached_ids.add(story_id)
-                results["updated"].append({
-                    "id": story_id, "devopsId": devops_id,
-                    "contentHash": story.get("contentHash", "")
-                })
-                progress(f"  Updated Story #{devops_id}")
+                return "failed", {"id": story_id, "devopsId": devops_id, "error": err}, devops_id, False
+
+            # Attach updated story .md file
+            attached = _queue_attachment(story_id, devops_id)
+            progress(f"  Updated Story #{devops_id}")
+            return "updated", {
+                "id": story_id, "devopsId": devops_id,
+                "contentHash": story.get("contentHash", "")
+            }, devops_id, attached
+
+        return None, None, None, False
+
+    def _needs_work(story):
+        cls = story.get("classification")
+        if cls in _SYNC_CLASSES:
+            return True
+        # An unchanged story still needs a worker when its attachment is missing
+        return (cls == "UNCHANGED" and story.get("attached") != "true" and bool(story.get("devopsId"))
+                and bool(org_url and pat and story_file_paths.get(story.get("id", ""))))
+
+    # Skips that need no network call are recorded inline in the ordered
+    # pass below; each story is checked once and that pass reuses the verdict
+    needs_work = [_needs_work(story) for story in stories]
+    pending = [story for story, needed in zip(stories, needs_work) if needed]
+    try:
+        outcomes = iter(_map_items(_sync_story, pending, ctx.max_workers))
+    finally:
+        # Every queued upload finishes before the results are read
+        if attach_pool is not None:
+            attach_pool.shutdown(wait=True)
+    for story, needed in zip(stories, needs_work):
+        story_id = story.get("id", "")
+        cls = story.get("classification", "")
+        if needed:
+            bucket, entry, devops_id, attached = next(outcomes)
+        elif cls in _SKIP_CLASSES:
+            bucket, entry, devops_id = "skipped", {"id": story_id, "classification": cls}, story.get("devopsId")
+            attached = cls == "UNCHANGED" and story.get("attached") == "true"
+        else:
+            continue
+        if isinstance(attached, Future):
+            attached = attached.result()
+        if devops_id:
+            id_map[story_id] = devops_id
+        if attached:
+            attached_ids.add(story_id)
+        if bucket:
+            results[bucket].append(entry)
+
+    if link_client:
+        _link_created_via_batch(link_client, results["created"], "epicDevopsId", ctx.max_workers)
 
     results["attachedIds"] = sorted(attached_ids)
     return results, id_map
 
 
-def sync_tasks(az_path: str, config: Dict[str, str], tasks: List[Dict[str, Any]], story_id_map: Dict[str, int]) -> Tuple[Dict[str, Any], Dict[str, int]]:
-    """Create/update tasks with parent links to stories. Returns (results, id_map)."""
+def sync_tasks(ctx: SyncContext, tasks: List[Dict[str, Any]], story_id_map: Dict[str, int]) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """Create/update tasks with parent links to stories. Returns (results, id_map).
+
+    With ctx.client set, NEW tasks are created and CHANGED ones updated up
+    front via $batch; without one, each call runs through az.
+    """
     results = {"created": [], "updated": [], "failed": [], "skipped": []}
     id_map = {}
 
-    area = config.get("areaPath", "")
-    iteration = get_default_iteration(config)
-    template = config.get("processTemplate", "Agile")
-    complete_state = get_complete_state(template)
+    az_path, client, project = ctx.az_path, ctx.client, ctx.project
+    area, iteration, complete_state = ctx.area, ctx.iteration, ctx.complete_state
 
-    for task in tasks:
+    def _create_ops(task):
+        story_devops_id = story_id_map.get(task.get("storyId", ""))
+        parent_url = client.work_item_url(story_devops_id) if story_devops_id else ""
+        return build_task_create_ops(task, area, iteration, complete_state=complete_state, parent_url=parent_url)
+
+    batch_created, batch_updated = {}, {}
+    if client:
+        batch_created = _create_via_batch(client, project, tasks, "Task", _create_ops, ctx.max_workers)
+        batch_updated = _update_via_batch(client, tasks, "Task", lambda task: build_task_update_ops(task, complete_state), ctx.max_workers)
+    # az creates can't carry the parent link; with REST credentials (for
+    # attachments) the links go out together in $batch after the loop
+    link_client = RestClient(ctx.org_url, ctx.pat) if not client and ctx.org_url and ctx.pat else None
+
+    def _sync_task(task):
+        """Sync one task. Returns (result bucket, result entry, mapped devops ID)."""
         cls = task.get("classification", "")
         task_id = task.get("id", "")
 
-        if cls == "UNCHANGED" or cls == "ORPHANED":
-            if task.get("devopsId"):
-                id_map[task_id] = task["devopsId"]
-            results["skipped"].append({"id": task_id, "classification": cls})
-            continue
-
         if cls == "NEW":
-            args = build_task_create_args(task, area, iteration)
-
             progress(f"Creating Task {task_id}: {task.get('description', '')[:60]}")
-            data, err = run_az(az_path, args)
+            # Batch creates already carry the parent link and state
+            fused = task_id in batch_created
+            if fused:
+                devops_id, err = batch_created[task_id]
+            else:
+                args = build_task_create_args(task, area, iteration, complete_state)
+                data, err = run_az(az_path, args)
+                devops_id = None if err else data.get("id")
 
             if err:
                 progress(f"  FAILED: {err}")
-                results["failed"].append({"id": task_id, "error": err})
-                continue
+                return "failed", {"id": task_id, "error": err}, None
 
-            devops_id = data.get("id")
             if not devops_id:
-                results["failed"].append({"id": task_id, "error": "No ID in response"})
-                continue
+                return "failed", {"id": task_id, "error": "No ID in response"}, None
 
-            id_map[task_id] = devops_id
             progress(f"  Created Task #{devops_id}")
 
             # Add parent link to story
             story_id = task.get("storyId", "")
             story_devops_id = story_id_map.get(story_id)
-            if story_devops_id:
-                link_args = [
-                    "boards", "work-item", "relation", "add",
-                    "--id", str(devops_id),
-                    "--relation-type", "parent",
-                    "--target-id", str(story_devops_id),
-                ]
-                _, link_err = run_az(az_path, link_args)
+            if story_devops_id and not fused and not link_client:
+                _, link_err = _add_parent_link(az_path, devops_id, story_devops_id)
                 if link_err:
                     progress(f"  WARNING: Parent link failed: {link_err}")
 
-            # If task is complete, update state
-            if task.get("complete", False):
-                state_args = [
-                    "boards", "work-item", "update",
-                    "--id", str(devops_id),
-                    "--state", complete_state,
-                ]
-                _, state_err = run_az(az_path, state_args)
-                if state_err:
-                    progress(f"  WARNING: State update failed: {state_err}")
-
-            results["created"].append({
+            return "created", {
                 "id": task_id, "devopsId": devops_id,
                 "storyDevopsId": story_devops_id,
                 "contentHash": task.get("contentHash", "")
-            })
+            }, devops_id
 
-        elif cls == "CHANGED":
+        if cls == "CHANGED":
             devops_id = task.get("devopsId")
             if not devops_id:
-                results["failed"].append({"id": task_id, "error": "No existing DevOps ID for update"})
-                continue
-
-            id_map[task_id] = devops_id
-            args = build_task_update_args(task, devops_id, complete_state)
+                return "failed", {"id": task_id, "error": "No existing DevOps ID for update"}, None
 
             progress(f"Updating Task {task_id} (#{devops_id})")
-            data, err = run_az(az_path, args)
+            if client:
+                err = batch_updated[task_id]
+            else:
+                data, err = run_az(az_path, build_task_update_args(task, devops_id, complete_state))
 
             if err:
                 progress(f"  FAILED: {err}")
-                results["failed"].append({"id": task_id, "devopsId": devops_id, "error": err})
-            else:
-                results["updated"].append({
-                    "id": task_id, "devopsId": devops_id,
-                    "contentHash": task.get("contentHash", "")
-                })
-                progress(f"  Updated Task #{devops_id}")
+                return "failed", {"id": task_id, "devopsId": devops_id, "error": err}, devops_id
+            progress(f"  Updated Task #{devops_id}")
+            return "updated", {
+                "id": task_id, "devopsId": devops_id,
+                "contentHash": task.get("contentHash", "")
+            }, devops_id
+
+        return None, None, None
+
+    # Only NEW/CHANGED tasks reach the workers. Skips are recorded inline in
+    # the same pass, which keeps the results and ID map in input order
+    pending = [task for task in tasks if task.get("classification") in _SYNC_CLASSES]
+    outcomes = iter(_map_items(_sync_task, pending, ctx.max_workers))
+    for task in tasks:
+        cls = task.get("classification", "")
+        if cls in _SYNC_CLASSES:
+            bucket, entry, devops_id = next(outcomes)
+        elif cls in _SKIP_CLASSES:
+            bucket, entry, devops_id = "skipped", {"id": task.get("id", ""), "classification": cls}, task.get("devopsId")
+        else:
+            continue
+        if devops_id:
+            id_map[task.get("id", "")] = devops_id
+        if bucket:
+            results[bucket].append(entry)
+
+    if link_client:
+        _link_created_via_batch(link_client, results["created"], "storyDevopsId", ctx.max_workers)
 
     return results, id_map
 
 
-def sync_epic_iterations(az_path: str, config: Dict[str, str], iterations: List[Dict[str, Any]], epic_id_map: Dict[str, int], story_id_map: Dict[str, int], task_id_map: Dict[str, int]) -> Dict[str, Any]:
-    """Create epic-based iterations and move epics, stories, and tasks into them."""
+def sync_epic_iterations(ctx: SyncContext, iterations: List[Dict[str, Any]], epic_id_map: Dict[str, int], story_id_map: Dict[str, int], task_id_map: Dict[str, int]) -> Dict[str, Any]:
+    """Create epic-based iterations and move epics, stories, and tasks into them.
+
+    Goes over REST when ctx has a client and a project is configured, else via
+    az. Over REST, all moves go out together through $batch at the end.
+    """
     results = {"created": [], "failed": [], "skipped": [], "movements": []}
 
     # Build iteration paths. Azure DevOps uses two different path formats:
     # - "iteration create --path" needs: \ProjectName\Iteration\ParentPath
     #   (the literal word "Iteration" is required between project and parent)
     # - "work-item update --iteration" needs: ProjectName\ParentPath\ChildName
-    project = config.get("projectName", "")
-    iter_root_raw = config.get("iterationRootPath", "")
+    az_path, project = ctx.az_path, ctx.project
+    iter_root_raw = ctx.iteration_root_path
     # For work-item --iteration (no "Iteration" segment, no leading backslash)
-    iteration_root = get_default_iteration(config)
-
-    def move_item(item_type, item_id, devops_id, iter_path, slug):
-        """Move a work item to an iteration path."""
-        assign_args = [
-            "boards", "work-item", "update",
-            "--id", str(devops_id),
-            "--iteration", iter_path,
-        ]
-        _, assign_err = run_az(az_path, assign_args)
+    iteration_root = ctx.iteration
+    # The REST endpoints are project-scoped
+    client = ctx.client if project else None
+
+    # Parent of new iterations, relative to the project's iteration root
+    iter_suffix = iter_root_raw
+    if project and iter_suffix.startswith(project + "\\"):
+        iter_suffix = iter_suffix[len(project) + 1:]
+
+    # az boards iteration project create --path requires:
+    # \ProjectName\Iteration\ParentIterationPath
+    # The literal "Iteration" segment is mandatory per Azure DevOps CLI.
+    # Same for every iteration, so built once.
+    create_path = ""
+    if project:
+        if iter_suffix:
+            create_path = f"\\{project}\\Iteration\\{iter_suffix}"
+        else:
+            create_path = f"\\{project}\\Iteration"
+
+    # Every move of the run, flattened in order:
+    # (item type, item ID, devops ID, iteration path, slug, REST patch)
+    moves = []
+    id_maps = {"story": story_id_map, "task": task_id_map}
+    iter_prefix = iteration_root + "\\" if iteration_root else ""
+
+    def record_move(item_type, item_id, devops_id, slug, assign_err):
+        """Log a move outcome and add it to the results."""
         if assign_err:
             progress(f"  WARNING: {item_type} {item_id} move failed: {assign_err}")
             results["movements"].append({
@@ -789,35 +1752,36 @@ def sync_epic_iterations(az_path: str, config: Dict[str, str], iterations: List[
             })
             progress(f"  Moved {item_type} #{devops_id} to {slug}")
 
+    def create_iteration(it):
+        """Create one iteration node. Returns (data, error) like run_az."""
+        slug = it.get("slug", "")
+        progress(f"Creating Iteration: {slug}")
+        if client:
+            return client.create_iteration(project, iter_suffix, slug)
+        args = [
+            "boards", "iteration", "project", "create",
+            "--name", slug,
+        ]
+        if create_path:
+            args += ["--path", create_path]
+        return run_az(az_path, args)
+
+    # New iterations don't depend on each other, so create them concurrently;
+    # the moves below then run in input order
+    new_its = [it for it in iterations if it.get("classification", "") == "NEW"]
+    creations = iter(_map_items(create_iteration, new_its, ctx.max_workers))
+
     for it in iterations:
         cls = it.get("classification", "")
         slug = it.get("slug", "")
         epic_id = it.get("epicId", "")
 
-        iter_path = f"{iteration_root}\\{slug}" if iteration_root else slug
+        iter_path = iter_prefix + slug
+        # One patch document shared by every item moved into this iteration
+        move_ops = [field_op("System.IterationPath", iter_path)] if client else None
 
         if cls == "NEW":
-            args = [
-                "boards", "iteration", "project", "create",
-                "--name", slug,
-            ]
-            if project:
-                # az boards iteration project create --path requires:
-                # \ProjectName\Iteration\ParentIterationPath
-                # The literal "Iteration" segment is mandatory per Azure DevOps CLI.
-                if iter_root_raw:
-                    # Strip project prefix if iterationRootPath already starts with it
-                    iter_suffix = iter_root_raw
-                    if iter_suffix.startswith(project + "\\"):
-                        iter_suffix = iter_suffix[len(project) + 1:]
-                    create_path = f"\\{project}\\Iteration\\{iter_suffix}"
-                else:
-                    create_path = f"\\{project}\\Iteration"
-                args += ["--path", create_path]
-
-            progress(f"Creating Iteration: {slug}")
-            data, err = run_az(az_path, args)
-
+            data, err = next(creations)
             if err:
                 progress(f"  FAILED: {err}")
                 results["failed"].append({"slug": slug, "epicId": epic_id, "error": err})
@@ -834,95 +1798,152 @@ def sync_epic_iterations(az_path: str, config: Dict[str, str], iterations: List[
         if cls == "NEW":
             epic_devops_id = epic_id_map.get(epic_id)
             if epic_devops_id:
-                move_item("epic", epic_id, epic_devops_id, iter_path, slug)
-
-        # Move stories into iteration
-        for story_id in it.get("storyIds", []):
-            story_devops_id = story_id_map.get(story_id)
-            if story_devops_id:
-                move_item("story", story_id, story_devops_id, iter_path, slug)
-            else:
-                progress(f"  WARNING: Story {story_id} not found in ID map, skipping")
+                moves.append(("epic", epic_id, epic_devops_id, iter_path, slug, move_ops))
+
+        # Move stories, then tasks, into iteration
+        for item_type, ids_key in (("story", "storyIds"), ("task", "taskIds")):
+            id_map = id_maps[item_type]
+            for item_id in it.get(ids_key) or ():
+                devops_id = id_map.get(item_id)
+                if devops_id:
+                    moves.append((item_type, item_id, devops_id, iter_path, slug, move_ops))
+                else:
+                    progress(f"  WARNING: {item_type.capitalize()} {item_id} not found in ID map, skipping")
 
-        # Move tasks into iteration
-        for task_id in it.get("taskIds", []):
-            task_devops_id = task_id_map.get(task_id)
-            if task_devops_id:
-                move_item("task", task_id, task_devops_id, iter_path, slug)
-            else:
-                progress(f"  WARNING: Task {task_id} not found in ID map, skipping")
+    if client and moves:
+        progress(f"Moving {len(moves)} work item(s) via $batch")
+        errors = batch_update_workitems(client, [(move[2], move[5]) for move in moves], ctx.max_workers)
+    else:
+        def _move_via_az(index):
+            _, _, devops_id, iter_path, _, _ = moves[index]
+            _, assign_err = run_az(az_path, [
+                "boards", "work-item", "update",
+                "--id", str(devops_id),
+                "--iteration", iter_path,
+            ])
+            return assign_err
+
+        # Moves run concurrently; an item listed in several iterations
+        # is still moved in list order
+        errors = [None] * len(moves)
+        for indices in _rounds([move[2] for move in moves]):
+            for index, err in zip(indices, _map_items(_move_via_az, indices, ctx.max_workers)):
+                errors[index] = err
+    for (item_type, item_id, devops_id, _, slug, _), err in zip(moves, errors):
+        record_move(item_type, item_id, devops_id, slug, err)
 
     return results
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Batch sync work items to Azure DevOps via az CLI"
+        description="Batch sync work items to Azure DevOps via REST or az CLI"
     )
     parser.add_argument("--diff", required=True, help="Path to diff results JSON (from compute-hashes.py)")
     parser.add_argument("--config", required=True, help="Path to devops-sync-config.yaml")
     parser.add_argument("--output", required=True, help="Path to write sync results JSON")
     parser.add_argument("--org", default="", help="Azure DevOps org URL (for story file attachments via REST API)")
+    parser.add_argument("--transport", choices=["rest", "az"], default="rest", help="Send work item calls over a persistent REST connection (rest, default) or one az process per call (az)")
+    parser.add_argument("--max-workers", type=int, default=None, help="Concurrent work item syncs per layer (default: maxParallel from config, else 8; 1 = serial)")
+    parser.add_argument("--quiet", action="store_true", help="Print only the summary to stdout instead of the full JSON")
+    parser.add_argument("--max-az-concurrency", type=int, default=None, help="Max az processes running at once (default: CPU count)")
     args = parser.parse_args()
+    if args.max_workers is not None and args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
+    if args.max_az_concurrency is not None:
+        if args.max_az_concurrency < 1:
+            parser.error("--max-az-concurrency must be at least 1")
+        set_az_concurrency(args.max_az_concurrency)
 
     # Find az CLI
     az_path = find_az_executable()
     progress(f"Using az CLI: {az_path}")
 
     # Load diff results
+    # json.load reads the whole file with one read() call, so a larger
+    # buffer or mmap would not save any syscalls
     with open(args.diff, "r", encoding="utf-8") as f:
         diff = json.load(f)
 
-    # Load config (simple YAML parser)
-    config = {}
-    with open(args.config, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith("#") or not line:
-                continue
-            m = __import__("re").match(r'^(\w+):\s*"?([^"]*)"?\s*$', line)
-            if m:
-                config[m.group(1)] = m.group(2).strip()
+    config = load_config(args.config)
 
     progress(f"Config loaded: template={config.get('processTemplate', '?')}, project={config.get('projectName', '?')}")
 
-    # Sync in dependency order
-    progress("\n=== Syncing Epics ===")
-    epic_statuses = diff.get("epicStatuses", {})
-    epic_results, epic_id_map = sync_epics(az_path, config, diff.get("epics", []), epic_statuses=epic_statuses)
+    max_workers = args.max_workers
+    if max_workers is None:
+        max_workers = _DEFAULT_MAX_WORKERS
+        max_parallel = config.get("maxParallel", "")
+        if max_parallel:
+            if max_parallel.isdigit() and int(max_parallel) >= 1:
+                max_workers = int(max_parallel)
+            else:
+                progress(f"WARNING: Ignoring invalid maxParallel '{max_parallel}' — using {max_workers}")
 
-    progress("\n=== Syncing Stories ===")
-    story_statuses = diff.get("storyStatuses", {})
-    story_file_paths = diff.get("storyFilePaths", {})
+    # REST access (org URL + PAT or az token) is needed for attachments and the REST transport
     attach_enabled = config.get("attachStoryFiles", "false").lower() == "true"
+    story_file_paths = diff.get("storyFilePaths", {})
     org_url = ""
     pat = ""
-    if attach_enabled:
+    token_provider = None
+    if attach_enabled or args.transport == "rest":
         org_url = args.org or config.get("organizationUrl", "") or config.get("orgUrl", "")
         pat = os.environ.get("AZURE_DEVOPS_EXT_PAT", "")
         if org_url and not pat:
             progress("No AZURE_DEVOPS_EXT_PAT set — fetching token from az CLI...")
             pat = get_az_access_token(az_path)
             if pat:
+                token_provider = functools.partial(get_az_access_token, az_path)
                 progress("Token acquired from az CLI session")
             else:
-                progress("WARNING: Could not acquire token — story file attachments will be skipped")
-    else:
+                progress("WARNING: Could not acquire token — REST calls and story file attachments will be skipped")
+    client = None
+    if args.transport == "rest":
+        if not config.get("projectName"):
+            # Work item endpoints are project-scoped; az can use its configured default project
+            progress("WARNING: REST transport needs projectName in config — falling back to az CLI")
+        elif org_url and pat:
+            client = RestClient(org_url, pat, token_provider=token_provider)
+            progress(f"Using REST transport: {client.org_url}")
+        else:
+            progress("WARNING: REST transport needs an org URL and access token — falling back to az CLI")
+    if not attach_enabled:
         progress("Story file attachments disabled (attachStoryFiles != true)")
+        story_file_paths = {}
+
+    ctx = build_sync_context(
+        az_path, config,
+        org_url=org_url,
+        pat=pat,
+        client=client,
+        max_workers=max_workers
+    )
+
+    # Sync in dependency order
+    progress("\n=== Syncing Epics ===")
+    epic_statuses = diff.get("epicStatuses", {})
+    # Layers are popped off the diff so each one's parsed items (descriptions,
+    # AC text) can be freed as soon as that layer is synced
+    epic_results, epic_id_map = sync_epics(ctx, diff.pop("epics", []), epic_statuses=epic_statuses)
+
+    # The HTML cache would otherwise keep the freed layer's text alive
+    wrap_html.cache_clear()
+
+    progress("\n=== Syncing Stories ===")
+    story_statuses = diff.get("storyStatuses", {})
     story_results, story_id_map = sync_stories(
-        az_path, config, diff.get("stories", []), epic_id_map,
+        ctx, diff.pop("stories", []), epic_id_map,
         story_statuses=story_statuses,
-        story_file_paths=story_file_paths,
-        org_url=org_url,
-        pat=pat
+        story_file_paths=story_file_paths
     )
 
+    wrap_html.cache_clear()
+
     progress("\n=== Syncing Tasks ===")
-    task_results, task_id_map = sync_tasks(az_path, config, diff.get("tasks", []), story_id_map)
+    task_results, task_id_map = sync_tasks(ctx, diff.pop("tasks", []), story_id_map)
 
     progress("\n=== Syncing Epic Iterations ===")
     iteration_results = sync_epic_iterations(
-        az_path, config, diff.get("iterations", []),
+        ctx, diff.pop("iterations", []),
         epic_id_map, story_id_map, task_id_map
     )
 
@@ -932,9 +1953,9 @@ def main():
         "stories": story_results,
         "tasks": task_results,
         "iterations": iteration_results,
-        "epicIdMap": {k: v for k, v in epic_id_map.items()},
-        "storyIdMap": {k: v for k, v in story_id_map.items()},
-        "taskIdMap": {k: v for k, v in task_id_map.items()},
+        "epicIdMap": epic_id_map,
+        "storyIdMap": story_id_map,
+        "taskIdMap": task_id_map,
         "summary": {
             "epicsCreated": len(epic_results["created"]),
             "epicsUpdated": len(epic_results["updated"]),
@@ -948,17 +1969,20 @@ def main():
             "tasksFailed": len(task_results["failed"]),
             "iterationsCreated": len(iteration_results["created"]),
             "iterationsFailed": len(iteration_results["failed"]),
-            "iterationMovements": len([m for m in iteration_results["movements"] if m["status"] == "moved"])
+            "iterationMovements": sum(1 for m in iteration_results["movements"] if m["status"] == "moved")
         }
     }
 
-    # Write output
+    # Write output: compact UTF-8 for the machine-read results file
     os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2)
+    with open(args.output, "wb") as f:
+        f.write(json_body(result))
 
-    # Print to stdout
-    print(json.dumps(result, indent=2))
+    # Print to stdout, indented for humans; --quiet skips the full copy
+    if args.quiet:
+        print(json.dumps(result["summary"]))
+    else:
+        print(json.dumps(result, indent=2))
 
     # Print summary to stderr
     s = result["summary"]
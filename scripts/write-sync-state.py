@@ -37,10 +37,13 @@ def yaml_val(val: Any) -> str:
     return f'"{val}"'
 
 
+_ID_TOKEN_RE = re.compile(r'\d+|[^\d]+')
+
+
 def sort_key_numeric(item_id: str) -> tuple:
     """Sort key that handles N.M, N.M-TN, N.M-RN.M patterns numerically."""
     # Split into tokens of text and numbers: "1.1-T10" -> ["1", ".", "1", "-", "T", "10"]
-    tokens = re.findall(r'\d+|[^\d]+', item_id)
+    tokens = _ID_TOKEN_RE.findall(item_id)
     result = []
     for t in tokens:
         if t.isdigit():
@@ -135,182 +138,193 @@ def write_sync_state(
 
     counts = {"epics": 0, "stories": 0, "tasks": 0, "iterations": 0,
               "pending_stories": 0, "pending_tasks": 0}
-    lines = []
-    lines.append(f"# Azure DevOps Sync State")
-    lines.append(f"# Last full sync: {timestamp}")
-    lines.append(f'lastFullSync: "{timestamp}"')
-    lines.append("")
-
-    # --- Epics ---
-    lines.append("epics:")
-    epics = sorted(diff_results.get("epics", []),
-                   key=lambda e: sort_key_numeric(e.get("id", "")))
-    for epic in epics:
-        eid = epic.get("id", "")
-        if epic.get("classification") == "ORPHANED":
-            continue
-        devops_id = epic_id_map.get(eid, epic.get("devopsId"))
-        if devops_id in (None, "None", ""):
-            continue
-        try:
-            devops_id = int(devops_id)
-        except (ValueError, TypeError):
-            continue
-        lines.append(f'  "{eid}":')
-        lines.append(f"    devopsId: {devops_id}")
-        lines.append(f'    contentHash: "{epic.get("contentHash", "")}"')
-        lines.append(f'    lastSynced: "{timestamp}"')
-        lines.append(f'    status: "synced"')
-        counts["epics"] += 1
-
-    lines.append("")
-
-    # --- Stories ---
-    # Build set of story IDs that have attachments (from sync results + diff state)
-    story_attached_ids = set(sync_results.get("stories", {}).get("attachedIds", []))
-    for story in diff_results.get("stories", []):
-        if story.get("attached") == "true":
-            story_attached_ids.add(story.get("id", ""))
-
-    lines.append("stories:")
-    stories = sorted(diff_results.get("stories", []),
-                     key=lambda s: sort_key_numeric(s.get("id", "")))
-    for story in stories:
-        sid = story.get("id", "")
-        if story.get("classification") == "ORPHANED":
-            continue
-        devops_id = story_id_map.get(sid, story.get("devopsId"))
-        epic_id = story.get("epicId", "")
-        epic_devops_id = epic_id_map.get(epic_id, "")
-
-        is_pending = devops_id in (None, "None", "")
-        lines.append(f'  "{sid}":')
-        if is_pending:
-            lines.append(f'    contentHash: "{story.get("contentHash", "")}"')
-            lines.append(f'    lastSynced: "{timestamp}"')
-            lines.append(f'    status: "pending"')
-            counts["pending_stories"] += 1
-        else:
-            try:
-                devops_id = int(devops_id)
-            except (ValueError, TypeError):
-                pass
-            lines.append(f"    devopsId: {devops_id}")
-            if epic_devops_id:
-                lines.append(f"    epicDevopsId: {epic_devops_id}")
-            lines.append(f'    contentHash: "{story.get("contentHash", "")}"')
-            lines.append(f'    lastSynced: "{timestamp}"')
-            lines.append(f'    status: "synced"')
-            if sid in story_attached_ids:
-                lines.append(f"    attached: true")
-        counts["stories"] += 1
-
-    lines.append("")
-
-    # --- Tasks ---
-    lines.append("tasks:")
-    tasks = sorted(diff_results.get("tasks", []),
-                   key=lambda t: sort_key_numeric(t.get("id", "")))
-    for task in tasks:
-        tid = task.get("id", "")
-        if task.get("classification") == "ORPHANED":
-            continue
-        devops_id = task_id_map.get(tid, task.get("devopsId"))
-        story_id = task.get("storyId", "")
-        story_devops_id = story_id_map.get(story_id, "")
-
-        is_pending = devops_id in (None, "None", "")
-        lines.append(f'  "{tid}":')
-        if is_pending:
-            lines.append(f'    contentHash: "{task.get("contentHash", "")}"')
-            lines.append(f'    lastSynced: "{timestamp}"')
-            lines.append(f'    status: "pending"')
-            counts["pending_tasks"] += 1
-        else:
-            try:
-                devops_id = int(devops_id)
-            except (ValueError, TypeError):
-                pass
-            lines.append(f"    devopsId: {devops_id}")
-            if story_devops_id:
-                lines.append(f"    storyDevopsId: {story_devops_id}")
-            lines.append(f'    contentHash: "{task.get("contentHash", "")}"')
-            lines.append(f'    lastSynced: "{timestamp}"')
-            lines.append(f'    status: "synced"')
-        counts["tasks"] += 1
-
-    lines.append("")
-
-    # --- Iterations ---
-    lines.append("iterations:")
-
-    # Merge: iterations from diff results (have slug/epicId/devopsId)
-    # plus any from sync results that were newly created
-    seen_slugs = set()
-    diff_iterations = diff_results.get("iterations", [])
-
-    for it in diff_iterations:
-        slug = it.get("slug", "")
-        epic_id = it.get("epicId", "")
-        if not slug:
-            continue
-        seen_slugs.add(slug)
-
-        # Get devopsId: prefer sync results (newly created), fall back to diff results
-        devops_id = None
-        if slug in iteration_map and iteration_map[slug].get("devopsId"):
-            devops_id = iteration_map[slug]["devopsId"]
-        elif it.get("devopsId") not in (None, "None", ""):
-            devops_id = it["devopsId"]
-
-        if devops_id is None:
-            continue
-
-        devops_path = f"\\{project}\\Iteration\\{iter_root}\\{slug}" if iter_root else f"\\{project}\\Iteration\\{slug}"
-
-        lines.append(f'  "{slug}":')
-        lines.append(f'    epicId: "{epic_id}"')
-        lines.append(f"    devopsId: {devops_id}")
-        lines.append(f'    devopsPath: "{devops_path}"')
-        lines.append(f'    lastSynced: "{timestamp}"')
-        counts["iterations"] += 1
-
-    # Add any iterations from sync results not already in diff results
-    for slug, data in iteration_map.items():
-        if slug not in seen_slugs and data.get("devopsId"):
-            epic_id = data.get("epicId", "")
-            devops_id = data["devopsId"]
-            devops_path = f"\\{project}\\Iteration\\{iter_root}\\{slug}" if iter_root else f"\\{project}\\Iteration\\{slug}"
-
-            lines.append(f'  "{slug}":')
-            lines.append(f'    epicId: "{epic_id}"')
-            lines.append(f"    devopsId: {devops_id}")
-            lines.append(f'    devopsPath: "{devops_path}"')
-            lines.append(f'    lastSynced: "{timestamp}"')
-            counts["iterations"] += 1
-
-    lines.append("")
-
-    # Write file
+    # Stream lines to a temp file rather than building the whole document
+    # in memory first, then os.replace() it into place: this file is the
+    # incremental sync cache, and a half-written one would make the next
+    # run re-create already-synced items
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    with open(output_path, "w", encoding="utf-8", newline="\n") as f:
-        f.write("\n".join(lines))
+    tmp_path = output_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            write = f.write
+
+            def emit(line: str) -> None:
+                write(line)
+                write("\n")
+
+            emit(f"# Azure DevOps Sync State")
+            emit(f"# Last full sync: {timestamp}")
+            emit(f'lastFullSync: "{timestamp}"')
+            emit("")
+
+            # --- Epics ---
+            emit("epics:")
+            epics = sorted(diff_results.get("epics", []),
+                           key=lambda e: sort_key_numeric(e.get("id", "")))
+            for epic in epics:
+                eid = epic.get("id", "")
+                if epic.get("classification") == "ORPHANED":
+                    continue
+                devops_id = epic_id_map.get(eid, epic.get("devopsId"))
+                if devops_id in (None, "None", ""):
+                    continue
+                try:
+                    devops_id = int(devops_id)
+                except (ValueError, TypeError):
+                    continue
+                emit(f'  "{eid}":')
+                emit(f"    devopsId: {devops_id}")
+                emit(f'    contentHash: "{epic.get("contentHash", "")}"')
+                emit(f'    lastSynced: "{timestamp}"')
+                emit(f'    status: "synced"')
+                counts["epics"] += 1
+
+            emit("")
+
+            # --- Stories ---
+            # Build set of story IDs that have attachments (from sync results + diff state)
+            story_attached_ids = set(sync_results.get("stories", {}).get("attachedIds", []))
+            for story in diff_results.get("stories", []):
+                if story.get("attached") == "true":
+                    story_attached_ids.add(story.get("id", ""))
+
+            emit("stories:")
+            stories = sorted(diff_results.get("stories", []),
+                             key=lambda s: sort_key_numeric(s.get("id", "")))
+            for story in stories:
+                sid = story.get("id", "")
+                if story.get("classification") == "ORPHANED":
+                    continue
+                devops_id = story_id_map.get(sid, story.get("devopsId"))
+                epic_id = story.get("epicId", "")
+                epic_devops_id = epic_id_map.get(epic_id, "")
+
+                is_pending = devops_id in (None, "None", "")
+                emit(f'  "{sid}":')
+                if is_pending:
+                    emit(f'    contentHash: "{story.get("contentHash", "")}"')
+                    emit(f'    lastSynced: "{timestamp}"')
+                    emit(f'    status: "pending"')
+                    counts["pending_stories"] += 1
+                else:
+                    try:
+                        devops_id = int(devops_id)
+                    except (ValueError, TypeError):
+                        pass
+                    emit(f"    devopsId: {devops_id}")
+                    if epic_devops_id:
+                        emit(f"    epicDevopsId: {epic_devops_id}")
+                    emit(f'    contentHash: "{story.get("contentHash", "")}"')
+                    emit(f'    lastSynced: "{timestamp}"')
+                    emit(f'    status: "synced"')
+                    if sid in story_attached_ids:
+                        emit(f"    attached: true")
+                counts["stories"] += 1
+
+            emit("")
+
+            # --- Tasks ---
+            emit("tasks:")
+            tasks = sorted(diff_results.get("tasks", []),
+                           key=lambda t: sort_key_numeric(t.get("id", "")))
+            for task in tasks:
+                tid = task.get("id", "")
+                if task.get("classification") == "ORPHANED":
+                    continue
+                devops_id = task_id_map.get(tid, task.get("devopsId"))
+                story_id = task.get("storyId", "")
+                story_devops_id = story_id_map.get(story_id, "")
+
+                is_pending = devops_id in (None, "None", "")
+                emit(f'  "{tid}":')
+                if is_pending:
+                    emit(f'    contentHash: "{task.get("contentHash", "")}"')
+                    emit(f'    lastSynced: "{timestamp}"')
+                    emit(f'    status: "pending"')
+                    counts["pending_tasks"] += 1
+                else:
+                    try:
+                        devops_id = int(devops_id)
+                    except (ValueError, TypeError):
+                        pass
+                    emit(f"    devopsId: {devops_id}")
+                    if story_devops_id:
+                        emit(f"    storyDevopsId: {story_devops_id}")
+                    emit(f'    contentHash: "{task.get("contentHash", "")}"')
+                    emit(f'    lastSynced: "{timestamp}"')
+                    emit(f'    status: "synced"')
+                counts["tasks"] += 1
+
+            emit("")
+
+            # --- Iterations ---
+            emit("iterations:")
+
+            # Merge: iterations from diff results (have slug/epicId/devopsId)
+            # plus any from sync results that were newly created
+            seen_slugs = set()
+            diff_iterations = diff_results.get("iterations", [])
+
+            for it in diff_iterations:
+                slug = it.get("slug", "")
+                epic_id = it.get("epicId", "")
+                if not slug:
+                    continue
+                seen_slugs.add(slug)
+
+                # Get devopsId: prefer sync results (newly created), fall back to diff results
+                devops_id = None
+                if slug in iteration_map and iteration_map[slug].get("devopsId"):
+                    devops_id = iteration_map[slug]["devopsId"]
+                elif it.get("devopsId") not in (None, "None", ""):
+                    devops_id = it["devopsId"]
+
+                if devops_id is None:
+                    continue
+
+                devops_path = f"\\{project}\\Iteration\\{iter_root}\\{slug}" if iter_root else f"\\{project}\\Iteration\\{slug}"
+
+                emit(f'  "{slug}":')
+                emit(f'    epicId: "{epic_id}"')
+                emit(f"    devopsId: {devops_id}")
+                emit(f'    devopsPath: "{devops_path}"')
+                emit(f'    lastSynced: "{timestamp}"')
+                counts["iterations"] += 1
+
+            # Add any iterations from sync results not already in diff results
+            for slug, data in iteration_map.items():
+                if slug not in seen_slugs and data.get("devopsId"):
+                    epic_id = data.get("epicId", "")
+                    devops_id = data["devopsId"]
+                    devops_path = f"\\{project}\\Iteration\\{iter_root}\\{slug}" if iter_root else f"\\{project}\\Iteration\\{slug}"
+
+                    emit(f'  "{slug}":')
+                    emit(f'    epicId: "{epic_id}"')
+                    emit(f"    devopsId: {devops_id}")
+                    emit(f'    devopsPath: "{devops_path}"')
+                    emit(f'    lastSynced: "{timestamp}"')
+                    counts["iterations"] += 1
+
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
     return counts
 
 
+# One `key: "value"` line; comment and blank lines never match
+_CONFIG_LINE_RE = re.compile(r'^[ \t]*(\w+):[ \t]*"?([^"\n]*)"?[ \t]*$', re.MULTILINE)
+
+
 def load_config(path: str) -> Dict:
-    """Load devops-sync-config.yaml with simple parser."""
-    config = {}
+    """Load devops-sync-config.yaml with simple parser (one regex scan over the file)."""
     with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            m = re.match(r'^(\w+):\s*"?([^"]*)"?\s*$', line)
-            if m:
-                config[m.group(1)] = m.group(2).strip()
-    return config
+        text = f.read()
+    return {m.group(1): m.group(2).strip() for m in _CONFIG_LINE_RE.finditer(text)}
 
 
 def main():
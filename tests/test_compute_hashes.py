@@ -25,6 +25,9 @@ class TestNormalize:
     def test_tabs_and_newlines(self):
         assert compute_hashes.normalize("\t  foo\tbar\n  ") == "foo bar"
 
+    def test_unicode_whitespace(self):
+        assert compute_hashes.normalize("\u00a0Foo\u2003\r\nBar\u3000") == "foo bar"
+
 
 # --- normalize_list ---
 
@@ -44,6 +47,13 @@ class TestNormalizeList:
     def test_filters_empty_strings(self):
         assert compute_hashes.normalize_list(["A", "", "  ", "B"]) == "a,b"
 
+    def test_non_string_items(self):
+        assert compute_hashes.normalize_list([2, 1]) == "1,2"
+
+    def test_repeated_calls_stable(self):
+        items = ["FR-2", "FR-1"]
+        assert compute_hashes.normalize_list(items) == compute_hashes.normalize_list(list(items)) == "fr-1,fr-2"
+
 
 # --- compute_hash ---
 
@@ -67,6 +77,32 @@ class TestComputeHash:
         assert h1 != h2
 
 
+# --- compute_hash_batch ---
+
+class TestComputeHashBatch:
+    def test_matches_single_hash(self):
+        inputs = ["a|b", "", "ünïcode|x", "a|b"]
+        assert compute_hashes.compute_hash_batch(inputs) == [compute_hashes.compute_hash(s) for s in inputs]
+
+    def test_empty_batch(self):
+        assert compute_hashes.compute_hash_batch([]) == []
+
+    def test_content_helpers_match_hash_fns(self):
+        epic = {"id": "1", "title": "T", "description": "D", "phase": "P", "requirements": ["FR-1"]}
+        story = {"id": "1.1", "title": "S", "userStoryText": "U", "acceptanceCriteria": "A"}
+        task = {"description": "Do it", "complete": True}
+        assert compute_hashes.compute_hash(compute_hashes.epic_content(epic, "done")) == \
+            compute_hashes.hash_epic(epic, {"1": "Done "})
+        assert compute_hashes.compute_hash(compute_hashes.story_content(story, "review")) == \
+            compute_hashes.hash_story(story, {"1.1": "review"})
+        assert compute_hashes.compute_hash(compute_hashes.task_content(task)) == compute_hashes.hash_task(task)
+
+    def test_normalize_statuses(self):
+        assert compute_hashes.normalize_statuses({"1": " In-Progress ", "2": "done"}) == \
+            {"1": "in-progress", "2": "done"}
+        assert compute_hashes.normalize_statuses(None) == {}
+
+
 # --- hash_epic ---
 
 class TestHashEpic:
@@ -186,6 +222,14 @@ class TestGenerateIterationSlug:
         assert slug == "epic-1-platform-operator-runtime-readiness"
 
 
+# --- load_json ---
+
+class TestLoadJson:
+    def test_utf8_roundtrip(self, tmp_file):
+        path = tmp_file('{"epics": [{"id": "1", "title": "Café"}]}', "parsed.json")
+        assert compute_hashes.load_json(path) == {"epics": [{"id": "1", "title": "Café"}]}
+
+
 # --- load_sync_state ---
 
 class TestLoadSyncState:
@@ -300,6 +344,22 @@ class TestLoadSyncState:
         assert "epicDevopsId" not in result["stories"]
         assert "storyDevopsId" not in result["tasks"]
 
+    def test_quoting_and_malformed_lines(self, tmp_file):
+        content = (
+            "stories:\n"
+            '  1.1 :  \n'
+            '    contentHash:   "abc"  \n'
+            "    devopsId: 7\n"
+            '    note: bad"value\n'
+            "     nested: ignored\n"
+            '  "1.2":\n'
+            "    status: synced\n"
+        )
+        path = tmp_file(content, "sync.yaml")
+        result = compute_hashes.load_sync_state(path)
+        assert result["stories"]["1.1"] == {"contentHash": "abc", "devopsId": 7}
+        assert result["stories"]["1.2"] == {"status": "synced"}
+
 
 # --- classify_items ---
 
@@ -355,6 +415,62 @@ class TestClassifyItems:
         assert by_id["3"] == "NEW"
         assert by_id["4"] == "ORPHANED"
 
+    def test_annotates_items_in_place(self):
+        parsed = [{"id": "1", "title": "Test"}]
+        stored = {"1": {"contentHash": "old", "devopsId": 100, "attached": "true"}}
+        results = compute_hashes.classify_items(parsed, stored, lambda x: "new")
+        assert results[0] is parsed[0]
+        assert list(results[0]) == ["id", "title", "contentHash", "classification", "devopsId", "attached"]
+
+    def test_precomputed_hashes(self):
+        parsed = [{"id": "1"}, {"id": "2"}]
+        stored = {"1": {"contentHash": "aaa", "devopsId": 10}}
+        results = compute_hashes.classify_items(parsed, stored, hashes=["aaa", "bbb"])
+        assert results[0]["classification"] == "UNCHANGED"
+        assert results[1]["classification"] == "NEW"
+        assert results[1]["contentHash"] == "bbb"
+
+
+# --- group_ids ---
+
+class TestGroupIds:
+    def test_preserves_order_and_skips_orphans(self):
+        stories = [
+            {"id": "1.2", "epicId": "1"},
+            {"id": "2.1", "epicId": "2"},
+            {"id": "1.1", "epicId": "1"},
+            {"id": "9.9"},
+        ]
+        groups = compute_hashes.group_ids(stories, "epicId")
+        assert dict(groups) == {"1": ["1.2", "1.1"], "2": ["2.1"]}
+
+
+# --- count_by_class / estimate_cli_calls ---
+
+class TestSummary:
+    def test_count_by_class(self):
+        items = [{"classification": "NEW"}, {"classification": "NEW"}, {"classification": "ORPHANED"}]
+        counts = compute_hashes.count_by_class(items)
+        assert counts == {"NEW": 2, "CHANGED": 0, "UNCHANGED": 0, "ORPHANED": 1, "EXISTS": 0}
+
+    def test_estimate_cli_calls(self):
+        stories = [
+            {"id": "1.1", "classification": "NEW"},
+            {"id": "1.2", "classification": "UNCHANGED"},
+            {"id": "1.3", "classification": "UNCHANGED", "attached": "true"},
+        ]
+        iterations = [{"classification": "NEW", "storyIds": ["1.1"], "taskIds": []}]
+        calls = compute_hashes.estimate_cli_calls(
+            compute_hashes.count_by_class([{"classification": "CHANGED"}]),
+            compute_hashes.count_by_class(stories),
+            compute_hashes.count_by_class([]),
+            stories, iterations,
+            {"1.1": "done"},
+            {"1.1": "/a.md", "1.2": "/b.md", "1.3": "/c.md"},
+        )
+        # epic update 1 + story create/link 2 + state 1 + attachments 2*2 + iteration 1 + epic move 1 + story move 1
+        assert calls == 11
+
 
 # --- EXISTS iteration filtering ---
 
@@ -362,70 +478,8 @@ class TestExistsIterationFiltering:
     """Verify that EXISTS iterations only include NEW items, not already-synced ones."""
 
     def _run_main_logic(self, parsed, sync_state):
-        """Run the iteration derivation logic from compute-hashes main().
-
-        Extracted here to test the filtering without invoking argparse.
-        """
-        epic_statuses = parsed.get("epicStatuses", {})
-        stored_iterations = sync_state.get("iterations", {})
-
-        story_ids_by_epic = {}
-        for story in parsed.get("stories", []):
-            eid = story.get("epicId", "")
-            if eid:
-                story_ids_by_epic.setdefault(eid, []).append(story["id"])
-
-        task_ids_by_story = {}
-        for task in parsed.get("tasks", []):
-            sid = task.get("storyId", "")
-            if sid:
-                task_ids_by_story.setdefault(sid, []).append(task["id"])
-
-        iteration_results = []
-        for epic in parsed.get("epics", []):
-            epic_id = epic.get("id", "")
-            status = epic_statuses.get(epic_id, "")
-            if status not in ("in-progress", "done"):
-                continue
-
-            existing_slug = None
-            for slug, iter_data in stored_iterations.items():
-                if iter_data.get("epicId") == epic_id:
-                    existing_slug = slug
-                    break
-
-            slug = existing_slug or compute_hashes.generate_iteration_slug(epic_id, epic.get("title", ""))
-
-            epic_story_ids = story_ids_by_epic.get(epic_id, [])
-            epic_task_ids = []
-            for sid in epic_story_ids:
-                epic_task_ids.extend(task_ids_by_story.get(sid, []))
-
-            stored = stored_iterations.get(slug, {})
-            has_devops_id = stored.get("devopsId") not in (None, "", "None")
-            if slug in stored_iterations and has_devops_id:
-                new_story_ids = [sid for sid in epic_story_ids
-                                 if sid not in sync_state.get("stories", {})]
-                new_task_ids = [tid for tid in epic_task_ids
-                                if tid not in sync_state.get("tasks", {})]
-                iteration_results.append({
-                    "slug": slug,
-                    "epicId": epic_id,
-                    "storyIds": new_story_ids,
-                    "taskIds": new_task_ids,
-                    "classification": "EXISTS",
-                    "devopsId": stored.get("devopsId")
-                })
-            else:
-                iteration_results.append({
-                    "slug": slug,
-                    "epicId": epic_id,
-                    "storyIds": epic_story_ids,
-                    "taskIds": epic_task_ids,
-                    "classification": "NEW",
-                    "devopsId": None
-                })
-        return iteration_results
+        """Run the iteration derivation logic from compute-hashes main()."""
+        return compute_hashes.derive_iterations(parsed, sync_state, parsed.get("epicStatuses", {}))
 
     def test_exists_iteration_excludes_synced_items(self):
         """An EXISTS iteration should not include stories/tasks already in sync state."""
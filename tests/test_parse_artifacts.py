@@ -71,6 +71,23 @@ class TestExtractReviewMetadata:
         result = parse_artifacts.extract_review_metadata(desc)
         assert result["cleanTitle"] == "Improve logging"
 
+    def test_file_path_before_trailing_tag(self):
+        result = parse_artifacts.extract_review_metadata("Refactor parser [src/p.py] [HIGH]")
+        assert result["priority"] == 1
+        assert result["filePath"] is None
+        assert result["cleanTitle"] == "Refactor parser"
+
+    def test_repeated_priority_uses_first(self):
+        result = parse_artifacts.extract_review_metadata("[LOW] Fix [HIGH] bug")
+        assert result["priority"] == 3
+        assert result["cleanTitle"] == "Fix bug"
+
+    def test_repeated_calls_return_independent_tags(self):
+        first = parse_artifacts.extract_review_metadata("[AI-Review] Fix bug")
+        first["tags"].append("mutated")
+        second = parse_artifacts.extract_review_metadata("[AI-Review] Fix bug")
+        assert second["tags"] == ["AI-Review"]
+
 
 # --- extract_ac_references ---
 
@@ -93,6 +110,14 @@ class TestExtractAcReferences:
     def test_sorted_output(self):
         assert parse_artifacts.extract_ac_references("Do thing (AC: 5, 1, 3)") == [1, 3, 5]
 
+    def test_space_separated_entry_ignored(self):
+        assert parse_artifacts.extract_ac_references("Do thing (AC: 1 2, 3)") == [3]
+
+    def test_repeated_calls_return_independent_lists(self):
+        first = parse_artifacts.extract_ac_references("Do thing (AC: 1)")
+        first.append(99)
+        assert parse_artifacts.extract_ac_references("Do thing (AC: 1)") == [1]
+
 
 # --- build_subtask_html ---
 
@@ -150,6 +175,14 @@ class TestDetectHeadingLevels:
     def test_empty_content(self):
         assert parse_artifacts.detect_heading_levels("") == (2, 3)
 
+    def test_heading_split_across_lines_ignored(self):
+        content = "##\nEpic 1: Foundation\n###\nStory 1.1: Init"
+        assert parse_artifacts.detect_heading_levels(content) == (2, 3)
+
+    def test_other_line_separators(self):
+        content = "Intro\u2028#### Story 1.1: Init"
+        assert parse_artifacts.detect_heading_levels(content) == (3, 4)
+
 
 # --- parse_epics_file ---
 
@@ -238,6 +271,19 @@ class TestParseEpicsFile:
         assert len(epics) == 2
         assert epics[0]["title"] == "First occurrence"
 
+    def test_story_content_ends_at_next_epic(self, tmp_file):
+        content = (
+            "## Epic 1: First\nDesc 1\n\n"
+            "### Story 1.1: Setup\nSetup text\n\n"
+            "## Epic 2: Second\nEpic two text\n\n"
+            "### Story 2.1: Build\nBuild text\n"
+        )
+        path = tmp_file(content)
+        epics, stories = parse_artifacts.parse_epics_file(path)
+        assert epics[1]["description"] == "Epic two text"
+        assert stories[0]["userStoryText"] == "Setup text"
+        assert stories[1]["userStoryText"] == "Build text"
+
     def test_nonexistent_file(self):
         epics, stories = parse_artifacts.parse_epics_file("/nonexistent/path.md")
         assert epics == []
@@ -471,3 +517,22 @@ class TestParseEpicStatuses:
         path = tmp_file("\n".join(lines), "sprint-status.yaml")
         result = parse_artifacts.parse_epic_statuses(path)
         assert len(result) == 15
+
+
+# --- _write_atomic ---
+
+class TestWriteAtomic:
+    def test_replaces_existing_file(self, tmp_file):
+        path = tmp_file("old contents", "out.json")
+        parse_artifacts._write_atomic(path, b'{"epics": []}\n')
+        with open(path, "rb") as f:
+            assert f.read() == b'{"epics": []}\n'
+        assert not os.path.exists(path + ".tmp")
+
+    def test_failed_write_leaves_target_untouched(self, tmp_file):
+        path = tmp_file("old contents", "out.json")
+        with pytest.raises(TypeError):
+            parse_artifacts._write_atomic(path, "not bytes")
+        with open(path, "r", encoding="utf-8") as f:
+            assert f.read() == "old contents"
+        assert not os.path.exists(path + ".tmp")
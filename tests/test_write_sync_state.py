@@ -226,3 +226,20 @@ class TestWriteSyncState:
         assert counts["epics"] == 1
         content = open(output, encoding="utf-8").read()
         assert '"99"' not in content
+
+    def test_failure_keeps_previous_state_file(self, tmp_path):
+        output = tmp_path / "sync.yaml"
+        output.write_text('lastFullSync: "before"\n', encoding="utf-8")
+        diff_results = {
+            "epics": [{"id": "1", "contentHash": "aaa", "classification": "UNCHANGED", "devopsId": 100}],
+            "stories": [],
+            "tasks": [None],  # fails mid-write, after the epics are out
+            "iterations": [],
+        }
+        sync_results = {"epicIdMap": {}, "storyIdMap": {}, "taskIdMap": {}, "iterations": {}}
+
+        with pytest.raises(AttributeError):
+            write_sync_state.write_sync_state(diff_results, sync_results, {}, "2026-01-01T00:00:00Z", str(output))
+
+        assert output.read_text(encoding="utf-8") == 'lastFullSync: "before"\n'
+        assert not (tmp_path / "sync.yaml.tmp").exists()